@@ -21,6 +21,7 @@ init()
 import pigpio
 
 from core.logger import Logger, Level
+from core.config_loader import ConfigLoader
 from hardware.pigpiod_util import PigpiodUtility
 from hardware.digital_potentiometer import DigitalPotentiometer # TEMP replace with digital_pot.py
 from hardware.brushless_motor import BrushlessMotor
@@ -50,7 +51,8 @@ try:
 
     _digital_pot = DigitalPotentiometer()
     _digital_pot.start()
-    _motor = BrushlessMotor(_pi)
+    _config = ConfigLoader(Level.INFO).configure()
+    _motor = BrushlessMotor(_pi, config=_config)
 
     _target_distance_mm = 500
     if _target_distance_mm > 0:
@@ -281,6 +281,8 @@ class Payload:
     floats. 
 
     '''
+    __slots__ = ('_event', '_value')
+
     def __init__(self, event, value):
         self._event = event
         self._value = value
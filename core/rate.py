@@ -8,6 +8,7 @@
 # author:   Murray Altheim
 # created:  2020-08-23
 # modified: 2024-08-07 - using time.perf_counter()
+# modified: 2026-10-16 - nanosecond mode uses an integer monotonic deadline
 #
 
 import time
@@ -25,14 +26,18 @@ class Rate():
     :param hertz:   the frequency of the loop in Hertz
     :param level:   the log level
     :param use_ns:  (optional) if True use a nanosecond counter instead of milliseconds
+
+    In nanosecond mode the loop is paced against an integer deadline from
+    time.monotonic_ns(), advanced by one period per call, so timing error
+    does not accumulate from one iteration to the next.
     '''
     def __init__(self, hertz, level=Level.INFO, use_ns=False):
         self._log = Logger('rate', level)
-        self._last_ns   = time.perf_counter_ns()
         self._last_time = time.perf_counter()
         self._dt_s = 1/hertz
         self._dt_ms = self._dt_s * 1000
-        self._dt_ns = self._dt_ms * 1000000
+        self._dt_ns = int(1_000_000_000 / hertz)
+        self._deadline_ns = time.monotonic_ns()
         self._use_ns = use_ns
         if self._use_ns:
             self._log.info('nanosecond rate set for {:d}Hz (period: {:>6.4f}sec/{:d}ms)'.format(hertz, self.get_period_sec(), self.get_period_ms()))
@@ -115,11 +120,13 @@ class Rate():
                 rate.wait()
         '''
         if self._use_ns:
-            _ns_diff = time.perf_counter_ns() - self._last_ns
-            _delay_sec = ( self._dt_ns - _ns_diff ) / ( 1000 * 1000000 )
-            if self._dt_ns > _ns_diff:
-                time.sleep(_delay_sec)
-            self._last_ns = time.perf_counter_ns()
+            self._deadline_ns += self._dt_ns
+            _delay_ns = self._deadline_ns - time.monotonic_ns()
+            if _delay_ns > 0:
+                time.sleep(_delay_ns * 1e-9)
+            else:
+                # deadline missed: resync to now rather than burst to catch up
+                self._deadline_ns -= _delay_ns
         else:
             _diff = time.perf_counter() - self._last_time
             _delay_sec = self._dt_s - _diff
@@ -104,8 +104,7 @@ class Speed(Enum):
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def __str__(self):
-        return 'Speed.{}:{}v={:5.2f};\t{:5.2f}->{:5.2f}.'.format(self.name, (' ' * max(0, (16 - len(self.name)))),
-                self._velocity, self._astern, self._ahead)
+        return _STR_FORMAT[self].format(self._velocity, self._astern, self._ahead)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     @staticmethod
@@ -219,4 +218,10 @@ class Speed(Enum):
             _speed_enum.astern = _astern_speeds.get(_speed_enum.name)
             _speed_enum.ahead  = _ahead_speeds.get(_speed_enum.name)
 
+# per-member __str__ templates with the padded name already in place
+_STR_FORMAT = {
+    _speed: 'Speed.{}:{}'.format(_speed.name, ' ' * max(0, 16 - len(_speed.name))) + 'v={:5.2f};\t{:5.2f}->{:5.2f}.'
+    for _speed in Speed
+}
+
 #EOF
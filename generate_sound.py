@@ -115,16 +115,16 @@ for _sound in _sounds:
     _order.append(_sound.mnemonic)
     _order.append(' ')
 
-def generate_dictionary():
+def generate_dictionary(sounds):
     '''
     Generate the dictionary used in MicroPython to map between
-    sound names and their corresponding filenames.
+    sound names and their corresponding filenames, from the list
+    of sounds already loaded from the source file.
     '''
-    _sounds = Sound.load_sounds('sounds-source.json')
     _sb = StringBuilder()
     _sb.append('# dictionary of sounds ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈\n\n')
     _sb.append('_sounds = [\n')
-    for _sound in _sounds:
+    for _sound in sounds:
         _name = _sound.name
         _filename = _sound.filename
         _sb.append('    (\'')
@@ -138,7 +138,7 @@ def generate_dictionary():
     return _sb.to_string()
 
 print('generating: sound_dictionary.py')
-_output = generate_dictionary()
+_output = generate_dictionary(_sounds)
 with open('tinyfx/sound_dictionary.py', 'w') as _output_file:
     _output_file.write(_output)
     print('wrote file: tinyfx/sound_dictionary.py')
@@ -0,0 +1,5 @@
+# colorama is initialised once when the hardware package is first imported,
+# rather than by each module; init() re-wraps the standard streams per call.
+from colorama import init as _colorama_init
+_colorama_init(autoreset=True)
+del _colorama_init
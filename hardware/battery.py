@@ -15,8 +15,7 @@
 import sys, itertools, traceback
 import asyncio
 from enum import Enum
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Level, Logger
 from core.event import Event
@@ -24,14 +24,14 @@
 # FG pin:        GPIO 24
 #
 
+import os
 import time
 import asyncio
 import itertools
+from collections import deque
 from threading import Thread
 from math import pi as π
-from datetime import datetime as dt
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import pigpio
 
@@ -49,19 +49,22 @@ class BrushlessMotor:
     # calibration constant: millimeters traveled per 1% speed per second
     CALIBRATION_MM_PER_PERCENT_PER_SEC = 5.48  # based on 10 rotations being 2199mm
 
-    def __init__(self, pi, pwm_pin=None, dir_pin=None, pwm_freq=25000, accel_delay=0.1, max_slew_rate=20, level=Level.INFO):
+    def __init__(self, pi, pwm_pin=None, dir_pin=None, fg_pin=None, pwm_freq=25000, accel_delay=0.1, max_slew_rate=20, config=None, level=Level.INFO):
         self._log = Logger('motor', level)
+        _cfg = config['krzos'].get('hardware').get('brushless_motor', {}) if config else {}
         self._pi                  = pi
         self._pwm_pin             = self.PWM_GPIO_PIN if pwm_pin is None else pwm_pin
         self._dir_pin             = self.DIR_GPIO_PIN if dir_pin is None else dir_pin
+        self._fg_pin              = self.FG_GPIO_PIN if fg_pin is None else fg_pin
         self._pwm_freq            = pwm_freq
         self._accel_delay         = accel_delay
         self._max_slew_rate       = max_slew_rate
         self._current_speed       = 0        # current speed (-100 to 100)
         self._target_speed        = 0        # target speed (-100 to 100)
+        self._last_sent_speed     = None     # last speed written to the PWM and direction pins
         self._kickstart_speed     = 14       # speed threshold to kickstart motor from zero
-        self._start_time          = None     # when current motion started
-        self._stop_time           = None     # when motor stopped or last speed change
+        self._start_time          = None     # when current motion started (monotonic seconds)
+        self._stop_time           = None     # when motor stopped or last speed change (monotonic seconds)
         self._verbose             = False
         # open or closed loop support ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
         self._closed_loop_enabled = True # TODO config
@@ -69,15 +72,17 @@ class BrushlessMotor:
             self._log.info("using closed loop control.")
         else:
             self._log.info("using open loop control.")
-        self._last_tick           = None
         self._pulse_count         = 0
-        self._pulse_intervals     = []
         self._max_interval_buffer = 10       # average over last N intervals
+        self._pulse_ticks         = deque(maxlen=self._max_interval_buffer + 1) # N+1 ticks span N intervals
         self._rpm_errors          = []       # for calculating PID performance
         self._feedback_interval   = 0.05     # seconds between corrections
         self._feedback_task       = None     # async task
         self._direction           = self.DIRECTION_FORWARD
+        self._direction_sign      = 1        # +1 forward, -1 reverse; set alongside _direction
         self._measured_rpm        = 0 
+        self._smoothed_rpm        = 0.0      # exponentially-weighted moving average of measured RPM
+        self._rpm_alpha           = _cfg.get('rpm_alpha', 0.3) # EWMA weight of the newest measurement
         self._kp                  = 0.1
         self._ki                  = 0.0
         self._kd                  = 0.0
@@ -86,12 +91,19 @@ class BrushlessMotor:
         _use_software_pwm         = False   # TODO from config
         # initialize PWM controller (hardware or software)
         self._pwm_controller = self._get_pwm_controller(_use_software_pwm)
+        # bound methods used on every PWM write
+        self._set_pwm  = self._pwm_controller.set_pwm
+        self._stop_pwm = self._pwm_controller.stop_pwm
+        self._write    = self._pi.write
         # odometry ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
         self._gear_ratio              = 45 # from motor spec on DFRobot page
         self._pulses_per_motor_rev    = 6 # ditto
         self._pulses_per_output_rev   = self._pulses_per_motor_rev * self._gear_ratio # 270
         self._wheel_diameter_mm       = 48 # TODO from config
         self._circumference_mm        = self._wheel_diameter_mm * π
+        # precomputed per-pulse constants
+        self._rpm_scale               = 60_000_000 / self._pulses_per_output_rev # µs per minute / pulses per rev
+        self._mm_per_pulse            = self._circumference_mm / self._pulses_per_output_rev
         self._cumulative_distance_mm  = 0.0
         self._initial_distance        = 0.0
         self._target_distance         = None
@@ -104,16 +116,16 @@ class BrushlessMotor:
         self._rpm_limiter = SlewLimiter(max_delta_per_sec=_max_delta_rpm_per_sec)
         self._speed_limiter = SlewLimiter(max_delta_per_sec=_max_delta_speed_per_sec)
         # establish callback from FB on GPIO pin using falling edge detection
-        self._pi.set_mode(self.FG_GPIO_PIN, pigpio.INPUT)
-        self._pi.set_pull_up_down(self.FG_GPIO_PIN, pigpio.PUD_OFF)
-        self._callback = self._pi.callback(self.FG_GPIO_PIN, pigpio.FALLING_EDGE, self._fg_callback)
+        self._pi.set_mode(self._fg_pin, pigpio.INPUT)
+        self._pi.set_pull_up_down(self._fg_pin, pigpio.PUD_OFF)
+        self._callback = self._pi.callback(self._fg_pin, pigpio.FALLING_EDGE, self._fg_callback)
         # stall & recovery management ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
         self._target_rpm              = 0    # target RPM (used in closed-loop mode)
         self._is_stalled              = False
-        self._last_target_rpm_set_dt  = None
+        self._last_target_rpm_set_time = None # monotonic time of last target RPM change
         self._stall_detection_grace_period_ms = 400 # or tweak to maybe ~500ms
         # pulse timing
-        self._last_tick_dt            = None # timestamp of last FG pulse
+        self._last_tick_time          = None # monotonic time of last FG pulse
         self._stall_timeout_ms        = 300  # duration with no pulses to declare stall (in ms)
         # deadband configuration
         self._deadband_rpm            = 6    # don't attempt to move at speed less than this
@@ -125,8 +137,9 @@ class BrushlessMotor:
         self.set_on_stall(self._handle_stall)
         self.set_on_recovery(self._handle_recovery)
         # asyncio event loop in background thread ┈┈┈┈┈┈┈┈┈┈
+        self._loop_rt_priority = _cfg.get('loop_rt_priority', 50) # SCHED_FIFO priority for the loop thread, requires CAP_SYS_NICE
         self._loop = asyncio.new_event_loop()
-        self._loop, self._loop_thread = self._start_event_loop_thread()
+        self._loop_thread = self._start_event_loop_thread()
         # start periodic stall monitor
         asyncio.run_coroutine_threadsafe(self._stall_monitor(), self._loop)
         self._log.info('ready.')
@@ -143,10 +156,13 @@ class BrushlessMotor:
             return HardwarePWMController(self._pi, self._pwm_pin, self._pwm_freq)
 
     def _start_event_loop_thread(self):
-        loop = asyncio.new_event_loop()
-        thread = Thread(target=loop.run_forever, daemon=True)
+        '''
+        Starts and returns a daemon thread running the already-created
+        event loop, so only one loop is ever allocated per motor.
+        '''
+        thread = Thread(target=self._start_loop, daemon=True)
         thread.start()
-        return loop, thread
+        return thread
 
     # properties ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
@@ -166,6 +182,14 @@ class BrushlessMotor:
         # apply direction sign dynamically when reading
         return -abs(self._measured_rpm) if self._direction == self.DIRECTION_REVERSE else abs(self._measured_rpm)
 
+    @property
+    def smoothed_rpm(self):
+        '''
+        Returns an exponentially-weighted moving average of the measured RPM,
+        signed by direction. This is less noisy than measured_rpm but lags it.
+        '''
+        return self._smoothed_rpm
+
     @property
     def measured_mm_per_sec(self):
         '''
@@ -212,8 +236,8 @@ class BrushlessMotor:
             await asyncio.sleep(0.3)
             # if FG pulses resume, _handle_recovery() will be called
             # so we just exit and let it resume PID
-            now = dt.now()
-            if self._last_tick_dt and (now - self._last_tick_dt).total_seconds() < 0.3:
+            now = time.monotonic()
+            if self._last_tick_time is not None and (now - self._last_tick_time) < 0.3:
                 self._log.info("Motor response detected during recovery.")
                 return
         self._log.warning("Recovery ramp failed — no FG detected.")
@@ -233,10 +257,10 @@ class BrushlessMotor:
         self.set_target_rpm(self._target_rpm)
 
     def _check_stall(self):
-        now = dt.now()
+        now = time.monotonic()
         # cooldown window: ignore stall detection immediately after RPM changes
-        if self._last_target_rpm_set_dt:
-            since_change_ms = (now - self._last_target_rpm_set_dt).total_seconds() * 1000
+        if self._last_target_rpm_set_time is not None:
+            since_change_ms = (now - self._last_target_rpm_set_time) * 1000
             if since_change_ms < self._stall_detection_grace_period_ms:
                 return  # skip checking
         # determine if we should be moving
@@ -248,9 +272,9 @@ class BrushlessMotor:
         if not target_moving:
             self._is_stalled = False
             return
-        if not hasattr(self, '_last_tick_dt') or self._last_tick_dt is None:
+        if self._last_tick_time is None:
             return  # haven’t seen a pulse yet
-        elapsed_ms = (now - self._last_tick_dt).total_seconds() * 1000
+        elapsed_ms = (now - self._last_tick_time) * 1000
         if elapsed_ms > self._stall_timeout_ms:
             if not self._is_stalled:
                 self._is_stalled = True
@@ -307,7 +331,7 @@ class BrushlessMotor:
             self._target_distance  = None
         self._distance_target_reached = False
         self._target_rpm = rpm
-        self._last_target_rpm_set_dt = dt.now()
+        self._last_target_rpm_set_time = time.monotonic()
         if self._verbose:
             self._log.info("closed loop target set to: " + Fore.GREEN + Style.DIM + "{} RPM".format(rpm))
         # apply kickstart if starting from zero and below threshold
@@ -339,6 +363,7 @@ class BrushlessMotor:
         self._last_error = 0
         self._last_target_rpm = None
         dt = self._feedback_interval
+        inv_dt = 1.0 / dt if dt > 0 else 0.0 # derivative multiplier, constant for the loop
         max_adjustment = 10  # max PID output adjustment (%)
         try:
             counter = itertools.count(1)
@@ -357,7 +382,7 @@ class BrushlessMotor:
                         )
                         self.stop()
                         break
-                adjustment, error = self._compute_pid_adjustment(dt, max_adjustment)
+                adjustment, error = self._compute_pid_adjustment(dt, inv_dt, max_adjustment)
                 new_speed = self._compute_new_speed(adjustment)
                 if self._verbose:
                     if next(counter) % 4 == 0:
@@ -382,13 +407,18 @@ class BrushlessMotor:
             return True
         return False
 
-    def _compute_pid_adjustment(self, dt, max_adjustment):
+    def _compute_pid_adjustment(self, dt, inv_dt, max_adjustment):
+        '''
+        Returns the clamped PID adjustment and the current error. The inverse
+        of dt is supplied by the caller so it is not recomputed every tick.
+        '''
         error = self._target_rpm - self.measured_rpm
-        self._integral_error += error * dt
-        derivative = (error - self._last_error) / dt if dt > 0 else 0
+        integral_error = self._integral_error + error * dt
+        derivative = (error - self._last_error) * inv_dt
+        self._integral_error = integral_error
         self._last_error = error
-        adjustment = self._kp * error + self._ki * self._integral_error + self._kd * derivative
-        adjustment = self._clamp(adjustment, -max_adjustment, max_adjustment)
+        adjustment = self._kp * error + self._ki * integral_error + self._kd * derivative
+        adjustment = -max_adjustment if adjustment < -max_adjustment else max_adjustment if adjustment > max_adjustment else adjustment
         if abs(adjustment) > 20:
             self._log.warning("Huge PID adjustment: {:.2f}".format(adjustment))
         return adjustment, error
@@ -403,7 +433,7 @@ class BrushlessMotor:
         return new_speed
 
     def _clamp(self, value, min_val, max_val):
-        return max(min_val, min(max_val, value))
+        return min_val if value < min_val else max_val if value > max_val else value
 
     def _apply_deadband(self, value, threshold):
         return 0 if abs(value) < threshold else value
@@ -416,46 +446,46 @@ class BrushlessMotor:
 
     def _fg_callback(self, gpio, level, tick):
         '''
-        Callback for open or closed loop control.
+        Callback for open or closed loop control. The pigpio tick (in
+        microseconds) is buffered directly, so no timestamp objects are
+        created per pulse.
         '''
         if self._verbose:
             self._log.info(Style.DIM + "tick: {}".format(tick))
         self._pulse_count += 1
-        self._last_tick_dt = dt.now()  # record time of this tick
-        if self._last_tick is not None:
-            interval = pigpio.tickDiff(self._last_tick, tick)  # in microseconds
-            self._pulse_intervals.append(interval)
-            if len(self._pulse_intervals) > self._max_interval_buffer:
-                self._pulse_intervals.pop(0)
+        self._last_tick_time = time.monotonic()  # record time of this tick
+        self._pulse_ticks.append(tick) # deque discards the oldest tick
+        if len(self._pulse_ticks) > 1:
             self._calculate_rpm()
         # update cumulative distance based on direction
-        distance_per_pulse = self._circumference_mm / self._pulses_per_output_rev
-        if self._direction == self.DIRECTION_FORWARD:
-            self._cumulative_distance_mm += distance_per_pulse
-        else:
-            self._cumulative_distance_mm -= distance_per_pulse
-        self._check_stall()
-        self._last_tick = tick
+        self._cumulative_distance_mm += self._direction_sign * self._mm_per_pulse
+        if self._is_stalled:
+            # a pulse can only change the stall state when recovering from a
+            # stall; otherwise the periodic stall monitor handles it
+            self._check_stall()
 
     def _calculate_rpm(self):
-        if not self._pulse_intervals:
+        '''
+        Calculate the RPM from the span between the oldest and newest buffered
+        ticks, which is O(1) regardless of the size of the buffer.
+        '''
+        _intervals = len(self._pulse_ticks) - 1
+        if _intervals < 1:
             self._measured_rpm = 0.0
             self._log.info("No pulse intervals available, RPM set to 0.")
             return
-        avg_interval_us = sum(self._pulse_intervals) / len(self._pulse_intervals)
+        # tickDiff handles the 32 bit microsecond tick wraparound
+        avg_interval_us = pigpio.tickDiff(self._pulse_ticks[0], self._pulse_ticks[-1]) / _intervals
         if avg_interval_us == 0:
             self._measured_rpm = 0.0
             self._log.info("Average pulse interval is zero, RPM set to 0.")
             return
-        pulses_per_minute = 60_000_000 / avg_interval_us
-        output_shaft_rpm = pulses_per_minute / self._pulses_per_output_rev
-        # adjust RPM sign based on current direction
-        if self._direction == self.DIRECTION_REVERSE:
-            output_shaft_rpm = -abs(output_shaft_rpm)
-        else:
-            output_shaft_rpm = abs(output_shaft_rpm)
+        # interval is positive, so the sign comes from the current direction
+        output_shaft_rpm = self._direction_sign * self._rpm_scale / avg_interval_us
         self._measured_rpm = output_shaft_rpm
-        self._log.debug("measured RPM: {:.2f}".format(self._measured_rpm))
+        self._smoothed_rpm += self._rpm_alpha * ( output_shaft_rpm - self._smoothed_rpm )
+        if not self._log.suppressed and self._log.level.value <= Level.DEBUG.value: # avoid formatting on every pulse
+            self._log.debug("measured RPM: {:.2f}".format(self._measured_rpm))
 
     def get_distance_future(self):
         '''
@@ -465,9 +495,22 @@ class BrushlessMotor:
 
     def _start_loop(self):
         self._log.info(Fore.GREEN + 'starting asyncio loop…')
+        self._set_realtime_priority()
         asyncio.set_event_loop(self._loop)
         self._loop.run_forever()
 
+    def _set_realtime_priority(self):
+        '''
+        Attempts to move the calling thread into the SCHED_FIFO real-time
+        class to reduce scheduling jitter in the feedback loop. This needs
+        root or CAP_SYS_NICE; otherwise the thread stays at normal priority.
+        '''
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self._loop_rt_priority))
+            self._log.info('asyncio loop thread running at real-time priority {:d}.'.format(self._loop_rt_priority))
+        except (AttributeError, OSError) as e:
+            self._log.warning('could not set real-time priority on asyncio loop thread: {}'.format(e))
+
     def stop_loop(self):
         '''
         Stops the asyncio loop, to be used upon closing.
@@ -480,7 +523,7 @@ class BrushlessMotor:
         """
         Reset odometry tracking to zero.
         """
-        self._start_time = dt.now()
+        self._start_time = time.monotonic()
         self._stop_time = None
         self._pulse_count = 0  # reset session pulse count for get_distance_mm()
         self._log.info("distance reset.")
@@ -492,13 +535,14 @@ class BrushlessMotor:
         """
         if self.is_closed_loop_enabled:
             rotations = self._pulse_count / self._pulses_per_output_rev
-            self._log.info(Style.DIM + "{:.2f} wheel rotations.".format(rotations))
+            if self._verbose:
+                self._log.info(Style.DIM + "{:.2f} wheel rotations.".format(rotations))
             return rotations * self._circumference_mm
         else:
             if self._start_time is None:
                 return 0.0
-            end_time = self._stop_time or dt.now()
-            elapsed = (end_time - self._start_time).total_seconds()
+            end_time = self._stop_time or time.monotonic()
+            elapsed = end_time - self._start_time
             # Distance = speed (%) * elapsed time (sec) * calibration constant (mm/%/sec)
             distance = abs(self._target_speed) * elapsed * self.CALIBRATION_MM_PER_PERCENT_PER_SEC
             return distance
@@ -511,16 +555,16 @@ class BrushlessMotor:
         # clamp speed to [-100, 100]
         speed = max(-100, min(100, speed))
         if speed == 0:
-            self._stop_time = dt.now()
+            self._stop_time = time.monotonic()
             self._target_speed = 0
             self._apply_pwm_sync(0)
             return
         if self._slew_limiter_enabled:
-            speed = self._speed_limiter.process(speed)
+            speed = self._speed_limiter.limit(speed)
         if target_mm > 0:
             self.reset_distance()
             self._target_speed = speed
-            self._start_time = dt.now()
+            self._start_time = time.monotonic()
             self._apply_pwm_sync(speed)
             self._log.info("speed set to {:+.2f}%, running to target {:.1f}mm".format(speed, target_mm))
             # run stop-at-distance coroutine in background
@@ -532,7 +576,7 @@ class BrushlessMotor:
             self._distance_future = future
         else:
             self._target_speed = speed
-            self._start_time = dt.now()
+            self._start_time = time.monotonic()
             self._apply_pwm_sync(speed)
             self._distance_future = None
         self._calculate_rpm()
@@ -554,13 +598,15 @@ class BrushlessMotor:
     def _apply_pwm_sync(self, speed):
         '''
         Synchronously ramps motor speed to target, sending PWM signals with delay between steps.
+        No delay follows the final step, so a single-step change returns immediately.
         '''
-        for _speed in self._ramp_speeds(speed):
+        for _index, _speed in enumerate(self._ramp_speeds(speed)):
+            if _index > 0:
+                time.sleep(self._accel_delay)
             self._send_pwm(_speed)
             if self._verbose:
                 self._log.info("_apply_pwm_sync() ramping to: {:3.2f} (direction: {})".format(_speed,
                         "FORWARD" if self._direction == self.DIRECTION_FORWARD else "REVERSE"))
-            time.sleep(self._accel_delay)
         if self._verbose:
             self._log.info("_apply_pwm_sync() final speed: {:3.2f} (direction: {})".format(_speed,
                     "FORWARD" if self._direction == self.DIRECTION_FORWARD else "REVERSE"))
@@ -569,15 +615,15 @@ class BrushlessMotor:
         '''
         Asynchronously ramps motor speed to target, sending PWM signals with async delays between steps.
         This is the older version that uses _ramp_speeds().
+        No delay follows the final step, so a single-step change returns immediately.
         '''
-        async def async_sleep():
-            await asyncio.sleep(self._accel_delay)
-        for _speed in self._ramp_speeds(speed):
+        for _index, _speed in enumerate(self._ramp_speeds(speed)):
+            if _index > 0:
+                await asyncio.sleep(self._accel_delay)
             self._send_pwm(_speed)
             if self._verbose:
                 self._log.info("_apply_pwm_async() ramping to: {:3.2f} (direction: {})".format(_speed,
                         "FORWARD" if self._direction == self.DIRECTION_FORWARD else "REVERSE"))
-            await async_sleep()
         if self._verbose:
             self._log.info("_apply_pwm_async() final speed: {:3.2f} (direction: {})".format(_speed,
                     "FORWARD" if self._direction == self.DIRECTION_FORWARD else "REVERSE"))
@@ -586,17 +632,23 @@ class BrushlessMotor:
         '''
         Send PWM and direction to the motor, using signed speed input.
         '''
-        self._direction = self.DIRECTION_FORWARD if speed >= 0 else self.DIRECTION_REVERSE
+        if speed >= 0:
+            self._direction, self._direction_sign = self.DIRECTION_FORWARD, 1
+        else:
+            self._direction, self._direction_sign = self.DIRECTION_REVERSE, -1
         self._current_speed = speed
+        if speed == self._last_sent_speed:
+            return # no change, skip redundant pin writes
+        self._last_sent_speed = speed
         abs_speed = abs(speed)
         if abs_speed == 0:
-            self._pwm_controller.stop_pwm()
-            self._pi.write(self._dir_pin, self.DIRECTION_FORWARD)  # default direction when stopped
+            self._stop_pwm()
+            self._write(self._dir_pin, self.DIRECTION_FORWARD)  # default direction when stopped
             if self._verbose:
                 self._log.info("motor stopped.")
         else:
-            self._pi.write(self._dir_pin, self._direction)
-            self._pwm_controller.set_pwm(abs_speed)
+            self._write(self._dir_pin, self._direction)
+            self._set_pwm(abs_speed)
             if self._verbose:
                 self._log.info("speed set to {speed:+.2f}% (direction: {dir}, duty inverted)".format(
                     speed=speed, dir="FORWARD" if self._direction == self.DIRECTION_FORWARD else "REVERSE"))
@@ -617,7 +669,6 @@ class BrushlessMotor:
         current = self._current_speed
         while abs(target_speed - current) > abs(step):
             current += step
-            current = self._clamp(current, min(target_speed, current), max(target_speed, current))
             yield current
         yield target_speed
 
@@ -660,6 +711,7 @@ class BrushlessMotor:
         self._speed_limiter.reset()
         self._reset_pid_state()
         self._target_rpm = 0.0
+        self._last_sent_speed = None # always write the stop
         self.set_speed(0)
         self._reset_fg_state()
         if self._verbose:
@@ -676,8 +728,8 @@ class BrushlessMotor:
         Reset all FG (feedback) pulse tracking state.
         """
         self._measured_rpm = 0.0 # reset measured RPM
-        self._last_tick = None
-        self._pulse_intervals.clear()
+        self._smoothed_rpm = 0.0
+        self._pulse_ticks.clear()
         self._pulse_count = 0 # optional, if you track odometry elsewhere
 
     def close(self):
@@ -720,27 +772,26 @@ class SlewLimiter:
         Resets the limiter to a specific value (or clears it).
         '''
         self._last_value = float(value) if value is not None else None
-        self._last_time = dt.now()
+        self._last_time = time.monotonic()
 
     def limit(self, new_value):
-        now = dt.now()
+        now = time.monotonic()
         new_value = float(new_value)
         if self._last_value is None:
             self._last_value = new_value
             self._last_time = now
             return new_value
-        elapsed = (now - self._last_time).total_seconds()
+        elapsed = now - self._last_time
         if elapsed <= 0.0:
             return self._last_value  # no time has passed
         # Prevent direction change unless speed is low
         if ( new_value * self._last_value < 0 and abs(self._last_value) > self.safe_threshold ):
             return self._last_value  # block reversal
-        # calculate allowed delta
+        # clamp the new value to within the allowed delta of the last value
         max_delta = self.max_delta_per_sec * elapsed
-        delta = new_value - self._last_value
-        if abs(delta) > max_delta:
-            delta = max_delta if delta > 0 else -max_delta
-            new_value = self._last_value + delta
+        lo = self._last_value - max_delta
+        hi = self._last_value + max_delta
+        new_value = lo if new_value < lo else hi if new_value > hi else new_value
         self._last_value = new_value
         self._last_time = now
         return new_value
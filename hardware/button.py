@@ -14,8 +14,7 @@ import sys, traceback, time
 import itertools
 import threading
 import RPi.GPIO as GPIO
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from core.component import Component
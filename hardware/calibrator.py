@@ -15,8 +15,7 @@ import itertools
 from datetime import datetime as dt
 from threading import Thread
 from math import isclose
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.chadburn import Chadburn
 from core.orientation import Orientation
@@ -12,8 +12,7 @@
 
 import time, itertools
 from datetime import datetime as dt
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import core.globals as globals
 globals.init()
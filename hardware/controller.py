@@ -13,8 +13,7 @@
 import traceback
 from smbus import SMBus
 import datetime as dt
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from hardware.payload import Payload 
@@ -9,8 +9,7 @@
 # created:  2025-05-07
 # modified: 2025-05-07
 #
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from hardware.motor_controller import MotorController
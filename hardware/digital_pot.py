@@ -13,8 +13,7 @@
 import sys, colorsys, traceback
 import ioexpander as io
 from math import isclose
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from core.component import Component
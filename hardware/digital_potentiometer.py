@@ -7,8 +7,7 @@ import time
 import asyncio
 import threading
 import colorsys
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import ioexpander as io
 from core.logger import Logger, Level
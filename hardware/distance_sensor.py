@@ -15,8 +15,7 @@ import asyncio
 from threading import Thread
 from collections import deque
 import pigpio
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import core.globals as globals
 globals.init()
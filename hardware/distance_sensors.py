@@ -10,8 +10,7 @@
 # modified: 2025-05-09
 #
 
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.component import Component
 from core.logger import Logger, Level
@@ -11,8 +11,7 @@
 #
 
 import asyncio
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import core.globals as globals
 globals.init()
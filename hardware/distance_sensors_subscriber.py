@@ -10,8 +10,7 @@
 # modified: 2025-05-08
 #
 
-from colorama import init, Fore, Style
-init(autoreset=True)
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from core.event import Event, Group
@@ -20,8 +20,7 @@ from pathlib import Path
 import datetime as dt
 from enum import Enum
 from evdev import InputDevice, ecodes
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from core.message_bus import MessageBus
@@ -14,8 +14,7 @@
 
 import time, itertools
 import datetime as dt
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.event import Event
 from core.logger import Logger, Level
@@ -14,8 +14,7 @@
 #
 
 import itertools
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import core.globals as globals
 globals.init()
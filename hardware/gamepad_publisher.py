@@ -17,8 +17,7 @@ import itertools, traceback
 from threading import Timer
 import time # only used for gamepad connection
 import asyncio
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from core.event import Event
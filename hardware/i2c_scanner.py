@@ -24,8 +24,7 @@
 #
 
 import errno
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Level, Logger
 
@@ -17,8 +17,7 @@ from math import pi as π
 from collections import deque
 from datetime import datetime as dt
 from colorsys import hsv_to_rgb
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from icm20948 import ICM20948
 from rgbmatrix5x5 import RGBMatrix5x5
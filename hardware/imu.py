@@ -14,8 +14,7 @@
 
 import asyncio
 from datetime import datetime as dt
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import core.globals as globals
 globals.init()
@@ -14,8 +14,7 @@
 
 import sys
 from math import isclose
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Level, Logger
 from core.component import Component
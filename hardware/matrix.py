@@ -13,8 +13,7 @@
 import sys, time, random
 import importlib.util
 from threading import Thread
-from colorama import init, Fore, Style
-init(autoreset=True)
+from colorama import Fore, Style
 
 from core.logger import Level, Logger
 from core.util import Util
@@ -68,6 +67,8 @@ class Matrices:
         if not self._port_matrix and not self._stbd_matrix:
             self._enabled = False
             self._log.warning('no matrix displays available.')
+        # orientation to matrix lookup for get_matrix()
+        self._matrices = { Orientation.PORT: self._port_matrix, Orientation.STBD: self._stbd_matrix }
         # define perentage to column converter
         self._percent_to_column = Ranger(0, 100, 0, 21)
         # TEMP counter
@@ -90,10 +91,7 @@ class Matrices:
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def get_matrix(self, orientation):
-        if orientation == Orientation.PORT:
-            return self._port_matrix
-        if orientation == Orientation.STBD:
-            return self._stbd_matrix
+        return self._matrices.get(orientation)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def set_brightness(self, brightness):
@@ -12,8 +12,7 @@
 
 import itertools
 from datetime import datetime as dt
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.component import Component
 from core.logger import Logger, Level
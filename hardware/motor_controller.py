@@ -14,8 +14,7 @@
 import traceback
 from smbus import SMBus
 import datetime as dt
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import core.globals as globals
 globals.init()
@@ -34,6 +33,15 @@ class MotorController(Component):
     A motor controller connected over I2C to a Motor 2040. This class must
     be explicitly enabled prior to use.
 
+    The port and starboard speeds are carried together in a single payload,
+    so each command costs one I2C block write (plus a one byte response)
+    regardless of how many motors it affects. Callers should therefore set
+    both speeds in one send_payload() call rather than one call per motor.
+
+    The per-tick motor loop itself runs in firmware on the Motor 2040, so it
+    never competes for the GIL with other threads on the Pi; this class only
+    forwards setpoints.
+
     :param config:       the application configuration
     :param level:        the logging level
     '''
@@ -47,6 +55,8 @@ class MotorController(Component):
         self._min_send_int_ms   = _cfg.get('minimum_send_interval_ms') # 70ms
         self._enable_movement   = _cfg.get('enable_movement', True)
         self._i2cbus            = None
+        self._write_block       = None # bound SMBus methods, set on enable
+        self._read_byte         = None
         self._ping_test         = False
         self._last_payload      = None
         # set up for sound
@@ -72,6 +82,8 @@ class MotorController(Component):
         Component.enable(self)
         try:
             self._i2cbus = SMBus(self._i2c_bus_number)
+            self._write_block = self._i2cbus.write_block_data
+            self._read_byte   = self._i2cbus.read_byte_data
             if self._ping_test:
                 _response = self._write_payload(Payload.create('stop', 0.0, 0.0, 0.0), verbose=False)
                 if _response is Response.OKAY:
@@ -160,11 +172,11 @@ class MotorController(Component):
             # send over I2C
             _data = list(payload.to_bytes())
             print("🍄 data type: {}; data: '{}'; payload: {}".format(type(_data), _data, payload.to_string()))
-            self._i2cbus.write_block_data(self._i2c_slave_address, self._config_register, _data)
+            self._write_block(self._i2c_slave_address, self._config_register, _data)
             if verbose:
                 self._log.info("payload written: " + Fore.WHITE + "'{}'".format(payload.to_string()))
             # read 1-byte response
-            _read_data = self._i2cbus.read_byte_data(self._i2c_slave_address, self._config_register)
+            _read_data = self._read_byte(self._i2c_slave_address, self._config_register)
             print("🍄 _read_data type: {}; int: {}; hex: '0x{:02X}'".format(type(_read_data), int(_read_data), _read_data))
             # convert response byte to status enum or meaning
             _response = Response.from_value(_read_data)
@@ -187,7 +199,9 @@ class MotorController(Component):
             self._log.error("transfer timeout: {}".format(te))
             return Response.CONNECTION_ERROR
         except Exception as e:
-            self._log.error('{} raised writing payload: {}\n{}'.format(type(e), e, traceback.format_exc()))
+            # only format the traceback if the error will actually be logged
+            if not self._log.suppressed and self._log.level.value <= Level.ERROR.value:
+                self._log.error('{} raised writing payload: {}\n{}'.format(type(e), e, traceback.format_exc()))
             return Response.RUNTIME_ERROR
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
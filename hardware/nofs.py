@@ -14,8 +14,7 @@ import asyncio
 import time
 from datetime import datetime as dt
 from pmw3901 import BG_CS_FRONT_BCM, PAA5100
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.component import Component
 from core.logger import Logger, Level
@@ -67,6 +66,7 @@ class NearOpticalFlowSensor(Component):
         self._tx     = 0.0
         self._ty     = 0.0
         self._spmm   = 6.43 # steps per millimeter, calibrated on a bamboo cutting board
+        self._inv_spmm = 1.0 / self._spmm # reciprocal, avoids a division per axis
         self._decay_rate     = 18    # decay rate per interval
         self._decay_interval = 0.03  # interval for decay logic in seconds
         self._poll_interval  = 0.2   # interval to poll the sensor
@@ -209,10 +209,7 @@ class NearOpticalFlowSensor(Component):
         Return the absolute (cumulative) positional change in millimeters
         since the previous poll.
         '''
-        _abs_x, _abs_y = int(self._tx), int(self._ty)
-        _dist_x = int(_abs_x / self._spmm)
-        _dist_y = int(_abs_y / self._spmm)
-        return _dist_x, _dist_y
+        return int(self._tx * self._inv_spmm), int(self._ty * self._inv_spmm)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def y_variance(self):
@@ -9,6 +9,8 @@
 # created:  2025-05-01
 # modified: 2025-05-26
 
+from functools import lru_cache
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class Payload:
     PACKET_LENGTH = 32  # 31-byte payload + 1-byte CRC
@@ -51,9 +53,19 @@ class Payload:
     def to_bytes(self):
         '''
         Encode command as 32 character payload to bytes: 31 ASCII characters + 1 CRC byte = 32 bytes.
+
+        Commands repeat often, so the encoding is cached per command string.
+        '''
+        return Payload._encode(self._command)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _encode(command):
+        '''
+        Pad or truncate the command, encode it and append its CRC.
         '''
-        payload = (self._command + ' ' * 31)[:31].encode('ascii') # pad or truncate, then encode in one line
-        crc = self._crc8_ccitt(payload)
+        payload = (command + ' ' * 31)[:31].encode('ascii') # pad or truncate, then encode in one line
+        crc = Payload._crc8_ccitt(payload)
         return payload + bytes([crc])
 
     @classmethod
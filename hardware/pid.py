@@ -15,8 +15,7 @@
 #
 
 import time, math
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from core.orientation import Orientation
@@ -46,9 +45,6 @@ class PID:
         self._max_output   = max_output
         self._sp_limit     = None
         self._target       = 0.0
-        self._setpoint_clip = lambda n: ( -1.0 * self._sp_limit ) if n <= ( -1.0 * self._sp_limit ) \
-                else self._sp_limit if n >= self._sp_limit \
-                else n
         if self._min_output is None or self._max_output is None:
             self._log.info('kp:{:7.4f}; ki:{:7.4f}; kd:{:7.4f}; min={}; max={}'.format(
                     self._kp, self._ki, self._kd, self._min_output, self._max_output))
@@ -104,22 +100,19 @@ class PID:
         argument exceeds the limit, the value is set to the limit.
         '''
         if self._sp_limit:
-            _tmp_setpoint = self._setpoint_clip(setpoint)
-            if setpoint > self._sp_limit:
-#               self._log.warning('setpoint {:5.2f} clipped; over limit: {:5.2f}'.format(setpoint, self._sp_limit))
-                self._setpoint = self._sp_limit
-            elif setpoint < -1.0 * self._sp_limit:
-#               self._log.warning('setpoint {:5.2f} clipped; under limit: {:5.2f}'.format(setpoint, self._sp_limit))
-                self._setpoint = -1.0 * self._sp_limit
-            else:
-#               self._log.info(Fore.GREEN + 'setpoint {:5.2f} not clipped; within limit: {:5.2f}'.format(setpoint, self._sp_limit))
-                self._setpoint = setpoint
-            if _tmp_setpoint != self._setpoint:
-                raise Exception('clip didnt work.')
+            self._setpoint = self._clip_setpoint(setpoint)
         else:
 #           self._log.info(Fore.GREEN + 'setpoint {:5.2f} not clipped; no limit set.'.format(setpoint))
             self._setpoint = setpoint
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _clip_setpoint(self, n):
+        '''
+        Returns the argument clipped to plus or minus the setpoint limit.
+        '''
+        _limit = self._sp_limit
+        return -_limit if n <= -_limit else _limit if n >= _limit else n
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     @property
     def limit(self):
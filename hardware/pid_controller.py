@@ -11,12 +11,10 @@
 #
 
 import sys
-from datetime import datetime as dt
+import time
 import itertools # TEMP
-from math import isclose
 from collections import deque as Deque
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from core.component import Component
@@ -41,6 +39,13 @@ class PIDController(Component):
     :param enabled:      Initial enabled state.
     :param level:        The log level, e.g., Level.INFO.
     '''
+    # verbose PID log line, assembled once rather than on every log call
+    PID_FORMAT = ( Fore.YELLOW + 'target speed: {:5.2f}; current speed: {:5.2f};'
+            + Fore.GREEN + Style.NORMAL + ' pid.setpoint: {:5.2f}; pid output: {:5.2f};'
+            + Fore.MAGENTA + ' error: {:<5.2f};'
+            + Fore.WHITE + ' motor power: {:<5.2f};'
+            + Fore.CYAN + Style.NORMAL + ' elapsed: {:d}ms' )
+
     def __init__(self, config, motor, setpoint=0.0, period=0.01, suppressed=False, enabled=True, level=Level.INFO):
         if not isinstance(config, dict):
             raise ValueError('wrong type for config argument: {}'.format(type(config)))
@@ -69,7 +74,8 @@ class PIDController(Component):
         self._target_speed = 0.0
         self._power        = 0.0
         self._last_power   = 0.0
-        self._last_time = dt.now() # for calculating elapsed time
+        self._speed_tolerance = 1e-2 # target speeds within this of zero are treated as stopped
+        self._last_time = time.monotonic() # for calculating elapsed time
         self._verbose      = True
         self._log.info('ready.')
 
@@ -145,11 +151,11 @@ class PIDController(Component):
         if _changed:
             self._target_speed = target_speed 
         if self.enabled:
-            _elapsed_ms = round(( dt.now() - self._last_time ).total_seconds() * 1000.0)
+            _pid = self._pid
             _count = next(self._counter)
-            if isclose(target_speed, 0.0, abs_tol=1e-2):
-                self._pid.setpoint = 0.0
-                self._pid.target   = 0.0
+            if -self._speed_tolerance <= target_speed <= self._speed_tolerance:
+                _pid.setpoint = 0.0
+                _pid.target   = 0.0
                 self._power        = 0.0
 #               self._motor.get_velocity().reset_steps()
                 self._motor.set_motor_power(0.0)
@@ -158,13 +164,13 @@ class PIDController(Component):
 #                       self._log.info(Fore.WHITE + Style.DIM + 'target speed: {:5.2f}; stopped; power: {:4.2f};\tvelocity: {:4.2f}'.format(target_speed, self._power, self._motor.velocity))
                     pass
             else:
-                self._pid.setpoint = target_speed
+                _pid.setpoint = target_speed
                 # converts speed to power...
-                self._pid.target = self._motor.velocity
+                _pid.target = self._motor.velocity
 
-                _error = self._pid.setpoint - self._pid.target
+                _error = _pid.setpoint - _pid.target
 
-                _pid_output = self._pid()
+                _pid_output = _pid()
 #               _pid_output = self._pid(self._motor.velocity)
 #               if _changed:
                 self._power += _pid_output
@@ -178,16 +184,12 @@ class PIDController(Component):
 #               self._motor.set_motor_power(0.0)
                 if self._verbose:
                     if _count % 20 == 0:
-                        self._log.info(Fore.YELLOW + 'target speed: {:5.2f}; current speed: {:5.2f};'.format(target_speed, self._motor.target_speed)
-                                + Fore.GREEN + Style.NORMAL + ' pid.setpoint: {:5.2f}; pid output: {:5.2f};'.format(self._pid.setpoint, _pid_output)
-#                               + Fore.MAGENTA + ' kp: {:7.4f}; ki: {:7.4f}; kd: {:7.4f})'.format(self._pid.kp, self._pid.ki, self._pid.kd)
-#                               + Fore.YELLOW + ' velocity: {:<5.2f};'.format(self._motor.velocity)
-                                + Fore.MAGENTA + ' error: {:<5.2f};'.format(_error)
-                                + Fore.WHITE + ' motor power: {:<5.2f};'.format(_motor_power)
-                                + Fore.CYAN + Style.NORMAL + ' elapsed: {:d}ms'.format(_elapsed_ms))
+                        _elapsed_ms = round(( time.monotonic() - self._last_time ) * 1000.0)
+                        self._log.info(PIDController.PID_FORMAT.format(target_speed, self._motor.target_speed,
+                                _pid.setpoint, _pid_output, _error, _motor_power, _elapsed_ms))
 
             self._last_power = self._power
-            self._last_time = dt.now()
+            self._last_time = time.monotonic()
         else:
             self._log.info(Fore.RED + 'pid controller disabled.')
 
@@ -13,8 +13,7 @@
 import psutil
 import subprocess
 from datetime import datetime as dt, timedelta
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 
@@ -11,8 +11,8 @@
 #
 
 import time
-from colorama import init, Fore, Style
-init()
+import asyncio
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from core.component import Component
@@ -30,8 +30,11 @@ class Player(Component):
 
         Player.instance().play(Sound.CHIRP)
 
-    Unlike the version of this on the MR01 this does not use threads, nor
-    does it support looping.
+    Unlike the version of this on the MR01 this does not support looping.
+    Sounds are posted to the TinyFxController's writer thread, so neither
+    method waits on the I2C transaction. From within a coroutine use
+    play_async(), which awaits the duration of the sound rather than
+    blocking the event loop.
     '''
 
     def __init__(self):
@@ -39,42 +42,64 @@ class Player(Component):
 
     @classmethod
     def instance(cls, tinyfx=None):
-        if cls.__instance is None:
-            cls.__instance = cls.__new__(cls)
-            # put any initialization here.
-            cls.__instance._log = Logger('player', Level.INFO)
-            Component.__init__(cls.__instance, cls.__instance._log, suppressed=False, enabled=True)
-            _config = ConfigLoader(Level.INFO).configure()
-            if tinyfx is None:
-                cls.__instance._log.info('TinyFX is none, initialising…')
-                cls.__instance._tinyfx_controller = TinyFxController(_config)
-            else:
-                cls.__instance._tinyfx_controller = tinyfx
-            _cfg = _config['krzos'].get('hardware').get('player')
-            cls.__instance._verbose = _cfg.get('verbose')
-            if not cls.__instance._tinyfx_controller.enabled:
-                cls.__instance._tinyfx_controller.enable()
-            cls.__instance._log.info('ready.')
-        return cls.__instance
+        '''
+        Returns the singleton instance, creating it on first call. The
+        tinyfx argument is only used when the instance is created.
+        '''
+        _instance = cls.__instance
+        if _instance is None:
+            _instance = cls.__instance = cls._create(tinyfx)
+        return _instance
+
+    @classmethod
+    def _create(cls, tinyfx):
+        _player = cls.__new__(cls)
+        _player._log = Logger('player', Level.INFO)
+        Component.__init__(_player, _player._log, suppressed=False, enabled=True)
+        _config = ConfigLoader(Level.INFO).configure()
+        if tinyfx is None:
+            _player._log.info('TinyFX is none, initialising…')
+            _player._tinyfx_controller = TinyFxController(_config)
+        else:
+            _player._tinyfx_controller = tinyfx
+        _cfg = _config['krzos'].get('hardware').get('player')
+        _player._verbose = _cfg.get('verbose')
+        _player._tail_sleep = _cfg.get('tail_sleep', 0.0)
+        if not _player._tinyfx_controller.enabled:
+            _player._tinyfx_controller.enable()
+        _player._log.info('ready.')
+        return _player
 
     @staticmethod
     def play(value):
         '''
-        Plays a Sound.
+        Plays a Sound, blocking for its duration.
+        '''
+        _player = Player._start(value)
+        time.sleep(value.duration + _player._tail_sleep)
+
+    @staticmethod
+    async def play_async(value):
+        '''
+        Plays a Sound, awaiting its duration without blocking the event loop.
+        '''
+        _player = Player._start(value)
+        await asyncio.sleep(value.duration + _player._tail_sleep)
+
+    @staticmethod
+    def _start(value):
+        '''
+        Validates the Sound and sends it to the TinyFX, returning the Player.
         '''
         if isinstance(value, Sound):
             _sound = value
         else:
             raise ValueError('expected a Sound.')
-        _name        = _sound.name
-        _duration    = _sound.duration
-        _description = _sound.description
-        _player      = Player.instance()
+        _player = Player.instance()
         if _player._verbose:
-            _player._log.info(Fore.MAGENTA + "playing '" + Style.BRIGHT + "{}".format(_name) + Style.NORMAL + "' ('{}') for {} seconds.".format(_description, _duration))
-        _player._tinyfx_controller.play(_sound.name)
-        time.sleep(_duration)
-        time.sleep(0.1)
+            _player._log.info(Fore.MAGENTA + "playing '" + Style.BRIGHT + "{}".format(_sound.name) + Style.NORMAL + "' ('{}') for {} seconds.".format(_sound.description, _sound.duration))
+        _player._tinyfx_controller.play(_sound.name, wait=False)
+        return _player
 
     # unsupported methods ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
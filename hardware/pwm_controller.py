@@ -10,32 +10,32 @@
 # modified: 2025-06-08
 #
 
-from abc import ABC, abstractmethod
 import pigpio
 from core.logger import Logger, Level
 
 # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-class PWMController(ABC):
+class PWMController:
     '''
-    Abstract base class for motor PWM controllers.
+    Base class for motor PWM controllers.
     All PWM controllers must implement set_pwm and stop_pwm.
     '''
+    __slots__ = ()
     STOPPED    = 1_000_000  # 100% duty (inverted logic)
     FULL_SPEED = 0          # 0% duty (inverted logic)
 
-    @abstractmethod
     def set_pwm(self, speed_percent):
-        pass
+        raise NotImplementedError('set_pwm() not implemented.')
 
-    @abstractmethod
     def stop_pwm(self):
-        pass
+        raise NotImplementedError('stop_pwm() not implemented.')
 
 # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 class HardwarePWMController(PWMController):
     '''
     A hardware PWM controller, using one of the Raspberry Pi specific hardware PWM pins.
     '''
+    __slots__ = ('_log', '_pi', '_pwm_pin', '_pwm_freq', '_last_duty')
+
     def __init__(self, pi, pwm_pin, pwm_freq, level=Level.INFO):
         self._log = Logger('hw-pwm', level)
         self._pi = pi
@@ -43,21 +43,28 @@ class HardwarePWMController(PWMController):
         self._pwm_freq = pwm_freq
         self._pi.set_mode(self._pwm_pin, pigpio.OUTPUT)
         self._pi.set_PWM_frequency(self._pwm_pin, self._pwm_freq)
+        self._last_duty = None
         self._log.info('ready.')
 
     def set_pwm(self, speed_percent):
         speed_percent = max(0, min(speed_percent, 100))
         duty_cycle = int((100 - speed_percent) * 10_000)  # inverted logic
+        if duty_cycle == self._last_duty:
+            return # unchanged, avoid reprogramming the channel
         self._pi.hardware_PWM(self._pwm_pin, self._pwm_freq, duty_cycle)
+        self._last_duty = duty_cycle
 
     def stop_pwm(self):
         self._pi.hardware_PWM(self._pwm_pin, self._pwm_freq, self.STOPPED)
+        self._last_duty = self.STOPPED
 
 # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 class SoftwarePWMController(PWMController):
     '''
     A software PWM controller, using one of the Raspberry Pi GPIO pins.
     '''
+    __slots__ = ('_log', '_pi', '_pwm_pin', '_pwm_freq', '_last_duty')
+
     def __init__(self, pi, pwm_pin, pwm_freq, level=Level.INFO):
         self._log = Logger('sw-pwm', level)
         self._pi = pi
@@ -66,14 +73,19 @@ class SoftwarePWMController(PWMController):
         self._pi.set_mode(self._pwm_pin, pigpio.OUTPUT)
         self._pi.set_PWM_frequency(self._pwm_pin, self._pwm_freq)
         self._pi.set_PWM_range(self._pwm_pin, 255)  # match pigpio default range
+        self._last_duty = None
         self._log.info('ready.')
 
     def set_pwm(self, speed_percent):
         speed_percent = max(0, min(speed_percent, 100))
         duty_cycle = int((100 - speed_percent) * 255 / 100)  # inverted logic
+        if duty_cycle == self._last_duty:
+            return # unchanged, avoid reprogramming the channel
         self._pi.set_PWM_dutycycle(self._pwm_pin, duty_cycle)
+        self._last_duty = duty_cycle
 
     def stop_pwm(self):
         self._pi.set_PWM_dutycycle(self._pwm_pin, 255)  # full stop (100% duty)
+        self._last_duty = 255
 
 #EOF
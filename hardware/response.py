@@ -15,32 +15,29 @@
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class Response:
+    '''
+    The value, label and description are plain slot attributes rather than
+    properties, as they are read for every I2C response. Each response is
+    also available as a class attribute named for its constant, e.g.,
+    RESPONSE_OKAY as Response.OKAY, whose name is 'OKAY'.
+    '''
+    __slots__ = ('value', 'label', 'description', 'name', '_str', '_repr')
     _instances = []
+    _by_value  = {} # value lookup for from_value(), the first defined wins
 
     def __init__(self, value: int, label: str, description: str):
-        self._value = value
-        self._label = label
-        self._description = description
+        self.value       = value
+        self.label       = label
+        self.description = description
+        self.name        = None # set when registered below
+        self._str  = 'Response.{}; value=0x{:02X}'.format(label, value)
+        self._repr = '<Response {} (0x{:02X})>'.format(label, value)
         Response._instances.append(self)
-
-    @property
-    def value(self):
-        return self._value
-
-    @property
-    def label(self):
-        return self._label
-
-    @property
-    def description(self):
-        return self._description
+        Response._by_value.setdefault(value, self)
 
     @classmethod
     def from_value(cls, value: int):
-        for instance in cls._instances:
-            if instance.value == value:
-                return instance
-        return None
+        return cls._by_value.get(value)
 
     @classmethod
     def from_label(cls, label: str):
@@ -66,16 +63,19 @@ class Response:
         return None
 
     def __int__(self):
-        return self._value
+        return self.value
 
     def __index__(self):
-        return self._value  # Allows use in bytes(), bytearray(), etc.
+        return self.value  # Allows use in bytes(), bytearray(), etc.
+
+    def __str__(self):
+        return self._str
 
     def __repr__(self):
-        return f"<Response{self._label} (0x{self._value:02X})>"
+        return self._repr
 
     def __format__(self, format_spec):
-        return format(self._value, format_spec)
+        return format(self.value, format_spec)
 
     def __eq__(self, other):
         if isinstance(other, Response):
@@ -107,4 +107,11 @@ RESPONSE_CONNECTION_ERROR   = Response(0x82, "RECE", "connection error")
 RESPONSE_RUNTIME_ERROR      = Response(0x83, "RERE", "runtime error")
 RESPONSE_UNKNOWN_ERROR      = Response(0x84, "REUE", "unknown error")
 
+# register each response as a class attribute, e.g., Response.OKAY
+for _name, _response in list(globals().items()):
+    if _name.startswith('RESPONSE_') and isinstance(_response, Response):
+        _response.name = _name[9:]
+        setattr(Response, _response.name, _response)
+del _name, _response
+
 #EOF
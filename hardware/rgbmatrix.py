@@ -15,8 +15,7 @@
 import sys, time, colorsys
 from threading import Thread
 from enum import Enum
-from colorama import init, Fore, Style
-init(autoreset=True)
+from colorama import Fore, Style
 
 try:
     try:
@@ -74,6 +73,8 @@ class RgbMatrix:
             self._has_stbd_rgbmatrix = True
         else:
             self._log.debug('no starboard rgbmatrix found.')
+        # orientation to matrix lookup for get_rgbmatrix()
+        self._rgbmatrices = { Orientation.PORT: self._port_rgbmatrix, Orientation.STBD: self._stbd_rgbmatrix }
         self._log.info('rgbmatrix width,height: {},{}'.format(5, 5))
         self._thread_PORT = None
         self._thread_STBD = None
@@ -410,14 +411,10 @@ class RgbMatrix:
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def get_rgbmatrix(self, orientation):
         '''
-        Return the port or starboard RGB matrix.
+        Return the port or starboard RGB matrix, or None for any other
+        orientation.
         '''
-        if orientation is Orientation.PORT:
-            return self._port_rgbmatrix
-        if orientation is Orientation.STBD:
-            return self._stbd_rgbmatrix
-        else:
-            return None
+        return self._rgbmatrices.get(orientation)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def show_hue(self, hue, orientation):
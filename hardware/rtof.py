@@ -38,12 +38,11 @@
 #
 # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
-import time, datetime
+import time
 
 import vl53l5cx_ctypes as vl53l5cx
 from vl53l5cx_ctypes import RANGING_MODE_CONTINUOUS # STATUS_RANGE_VALID, STATUS_RANGE_VALID_LARGE_PULSE, RANGING_MODE_AUTONOMOUS
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.component import Component
 from core.logger import Logger, Level
@@ -71,6 +70,9 @@ class RangingToF(Component):
         self._log.info('enabled: {}'.format(_enabled))
         # set up VL53L5CX
         self._initialised = False
+        self._ranging_freq_hz = 15
+        self._frame_period    = 1.0 / self._ranging_freq_hz
+        self._next_frame_time = None # monotonic time the next frame is expected
         self._vl53 = self._getVL53()
         self._log.info('ready.')
 
@@ -83,7 +85,7 @@ class RangingToF(Component):
         '''
         Instantiate the sensor.
         '''
-        stime = datetime.datetime.now()
+        stime = time.monotonic_ns()
         if self._initialised:
             self._log.info("initialising VL53L5CX…")
             vl53 = vl53l5cx.VL53L5CX(skip_init=True)
@@ -92,10 +94,10 @@ class RangingToF(Component):
             vl53 = vl53l5cx.VL53L5CX()
             self._initialised = True
         vl53.set_resolution(8 * 8)
-        vl53.set_ranging_frequency_hz(15)
+        vl53.set_ranging_frequency_hz(self._ranging_freq_hz)
         vl53.set_integration_time_ms(20)
         vl53.set_ranging_mode(RANGING_MODE_CONTINUOUS)
-        executionMs = int((datetime.datetime.now() - stime).total_seconds() * 1000)
+        executionMs = (time.monotonic_ns() - stime) // 1_000_000
         self._log.info(Fore.BLUE + 'get VL53: {}ms elapsed.'.format(executionMs))
         return vl53
 
@@ -104,12 +106,20 @@ class RangingToF(Component):
         '''
         Wait until the data from the vl53 is ready, returning the data,
         otherwise None upon a timeout.
+
+        Once a frame has been read, sleeps until shortly before the next
+        frame is due rather than polling through the whole frame period.
         '''
-        stime = datetime.datetime.now()
+        stime = time.monotonic_ns()
+        if self._next_frame_time is not None:
+            _delay = self._next_frame_time - time.monotonic() - 0.005
+            if _delay > 0.0:
+                time.sleep(_delay)
         for i in range(1,20):
             if self._vl53.data_ready():
+                self._next_frame_time = time.monotonic() + self._frame_period
                 _data = self._vl53.get_data() # 2d array of distance
-                executionMs = int((datetime.datetime.now() - stime).total_seconds() * 1000)
+                executionMs = (time.monotonic_ns() - stime) // 1_000_000
                 self._log.info('get data: {:d}ms elapsed.'.format(executionMs))
                 return _data
             time.sleep(1 / 1000)
@@ -10,7 +10,7 @@
 # modified: 2024-10-31
 #
 
-from math import isclose
+from math import copysign
 
 from core.logger import Level, Logger
 from core.component import Component
@@ -90,19 +90,19 @@ class SlewLimiter(Component):
         '''
         # Calculate the difference at internal resolution (float)
         difference = self._target_speed - self._internal_speed
+        _abs_difference = abs(difference)
 
         # Adjust the internal speed incrementally towards the target speed
-        if abs(difference) > 0:
-            # Determine the step size based on the rate and the direction
-            step = min(abs(difference), self._rate) * (1 if difference > 0 else -1)
-            self._internal_speed += step
-
-        # Snap to target using math.isclose
-        if isclose(self._target_speed, self._internal_speed, abs_tol=1e-3):
-            self._internal_speed = self._target_speed
-
-        # Return the constrained output speed as an integer
-        return int(self.current_speed)
+        if _abs_difference:
+            # step by up to the rate, carrying the sign of the difference
+            self._internal_speed += copysign(min(_abs_difference, self._rate), difference)
+            # snap to target once within tolerance
+            if abs(self._target_speed - self._internal_speed) < 1e-3:
+                self._internal_speed = self._target_speed
+
+        # Return the constrained output speed as an integer (inlined current_speed)
+        _speed = self._internal_speed * 0.001
+        return int(-100.0 if _speed < -100.0 else 100.0 if _speed > 100.0 else _speed)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def update(self):
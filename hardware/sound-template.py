@@ -12,19 +12,29 @@
 # DO NOT EDIT: This is an auto-generated file.
 #
 
+import sys
 import json
 from enum import Enum
-from colorama import init, Fore, Style
-init()
+try:
+    import orjson
+    _ORJSON_IMPORTED = True
+except ImportError:
+    _ORJSON_IMPORTED = False
 
 from core.logger import Logger, Level
 
 # JSON serialisation ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 from json import JSONEncoder
-def _default(self, obj):
-    return getattr(obj.__class__, "to_json", _default.default)(obj)
-_default.default = JSONEncoder().default
-JSONEncoder.default = _default
+class _SoundEncoder(JSONEncoder):
+    '''
+    Encodes any object providing a to_json() method, otherwise defers to
+    the standard encoder. Pass as cls= rather than patching JSONEncoder.
+    '''
+    def default(self, obj):
+        _to_json = getattr(obj, 'to_json', None)
+        if _to_json is not None:
+            return _to_json()
+        return JSONEncoder.default(self, obj)
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class Sound(Enum):
@@ -35,11 +45,27 @@ class Sound(Enum):
     # ignore the first param since it's already set by __new__
     def __init__(self, num, name, mnemonic, duration, filename, description):
         self._index = num
-        self._name = name
-        self._mnemonic = mnemonic
+        # interned, as these are used as lookup keys and compared often
+        self._name = sys.intern(name)
+        self._mnemonic = sys.intern(mnemonic)
         self._duration = duration
-        self._filename = filename
-        self._description = description
+        self._filename = sys.intern(filename)
+        self._description = sys.intern(description)
+        self._json = {
+            'index':       num,
+            'name':        self._name,
+            'mnemonic':    self._mnemonic,
+            'duration':    duration,
+            'filename':    self._filename,
+            'description': self._description
+        }
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def __hash__(self):
+        '''
+        Hash on the index, which is unique (checked at import).
+        '''
+        return self._index
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     @property
@@ -75,43 +101,68 @@ class Sound(Enum):
     @classmethod
     def from_name(cls, name: str):
         name = name.lower()
-        for sound in cls:
-            if sound.value[1].lower() == name:
-                return sound
-        raise ValueError("no sound enum with name '{}'".format(name))
+        _sound = _SOUNDS_BY_NAME.get(name)
+        if _sound is None:
+            raise ValueError("no sound enum with name '{}'".format(name))
+        return _sound
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @classmethod
+    def from_mnemonic(cls, mnemonic: str):
+        _sound = _SOUNDS_BY_MNEMONIC.get(mnemonic)
+        if _sound is None:
+            raise ValueError("no sound enum with mnemonic '{}'".format(mnemonic))
+        return _sound
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     @staticmethod
     def from_index(value):
         if isinstance(value, Sound):
-            _index = value.index
-        elif isinstance(value, int):
-            _index = value
-        else:
+            return value
+        elif not isinstance(value, int):
             raise Exception('expected Sound or int argument, not: {}'.format(type(value)))
-        for s in Sound:
-            if _index == s.index:
-                return s
-        raise NotImplementedError
+        _sound = _SOUNDS_BY_INDEX.get(value)
+        if _sound is None:
+            raise NotImplementedError
+        return _sound
 
     # JSON serialisation ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     @staticmethod
     def export():
-        _records = []
-        for _record in Sound:
-            _records.append(_record)
-        with open('sounds.json', 'w', encoding='utf-8') as f:
-            json.dump(_records, f, ensure_ascii=False, indent=4)
+        '''
+        Writes the sound metadata to 'sounds.json', using orjson if it is
+        installed and the standard json module otherwise. Both write with a
+        two space indent, the only indent orjson supports, so the file's
+        layout does not depend on which is installed.
+        '''
+        _records = [ _sound.to_json() for _sound in Sound ]
+        if _ORJSON_IMPORTED:
+            with open('sounds.json', 'wb') as f:
+                f.write(orjson.dumps(_records, option=orjson.OPT_INDENT_2))
+        else:
+            with open('sounds.json', 'w', encoding='utf-8') as f:
+                json.dump(_records, f, cls=_SoundEncoder, ensure_ascii=False, indent=2)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def to_json(self):
-        _dict = {}
-        _dict['index']       = self._index
-        _dict['name']        = self._name
-        _dict['mnemonic']    = self._mnemonic
-        _dict['duration']    = self._duration
-        _dict['filename']    = self._filename
-        _dict['description'] = self._description
-        return _dict
+        '''
+        Returns the JSON-serialisable dict for this Sound, built once when
+        the member is created. Sounds are immutable, so callers must not
+        modify it.
+        '''
+        return self._json
+
+# lookups for Sound.from_index(), from_name() and from_mnemonic(); indices must be unique
+_SOUNDS_BY_INDEX    = {}
+_SOUNDS_BY_NAME     = {}
+_SOUNDS_BY_MNEMONIC = {}
+for _sound in Sound:
+    if _sound.index in _SOUNDS_BY_INDEX:
+        raise ValueError('duplicate sound index {}: {} and {}.'.format(
+                _sound.index, _SOUNDS_BY_INDEX[_sound.index].name, _sound.name))
+    _SOUNDS_BY_INDEX[_sound.index] = _sound
+    _SOUNDS_BY_NAME.setdefault(_sound.name.lower(), _sound)
+    _SOUNDS_BY_MNEMONIC.setdefault(_sound.mnemonic, _sound)
+del _sound
 
 #EOF
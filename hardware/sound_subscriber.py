@@ -10,9 +10,9 @@
 # modified: 2024-11-25
 #
 
+import sys
 import asyncio
-from colorama import init, Fore, Style
-init(autoreset=True)
+from colorama import Fore, Style
 
 import core.globals as globals # TEMP
 globals.init()
@@ -23,6 +23,37 @@ from core.subscriber import Subscriber
 from hardware.sound import Sound
 from hardware.player import Player
 
+# colour codes, bound once and left blank when stdout is not a terminal
+_IS_TTY = sys.stdout.isatty()
+_RED    = Fore.RED     if _IS_TTY else ''
+_GREEN  = Fore.GREEN   if _IS_TTY else ''
+_BLUE   = Fore.BLUE    if _IS_TTY else ''
+_YELLOW = Fore.YELLOW  if _IS_TTY else ''
+_DIM    = Style.DIM    if _IS_TTY else ''
+_BRIGHT = Style.BRIGHT if _IS_TTY else ''
+
+# log message templates, built once
+_BUMPER_FORMAT   = _BRIGHT + 'BUMPER: message {}; ' + _YELLOW + 'event: {}; value: {}'
+_INFRARED_FORMAT = '{} infrared: {:d}mm'
+_PRE_FORMAT      = 'pre-processing message {}; ' + _YELLOW + ' event: {}'
+
+# templates for groups that are only logged
+_GROUP_FORMAT = {
+    Group.SYSTEM:    _DIM + 'SYSTEM: message {}; '    + _YELLOW + ' event: {}', #  1, "system"
+    Group.GAMEPAD:   _DIM + 'GAMEPAD: message {}; '   + _YELLOW + ' event: {}', #  3, "gamepad"
+    Group.STOP:      _DIM + 'STOP: message {}; '      + _YELLOW + ' event: {}', #  4, "stop"
+    Group.IMU:       _DIM + 'IMU: message {}; '       + _YELLOW + ' event: {}', #  7, "imu"
+    Group.BEHAVIOUR: _DIM + 'BEHAVIOUR: message {}; ' + _YELLOW + ' event: {}', # 11, "behaviour"
+    Group.REMOTE:    _DIM + 'REMOTE: message {}; '    + _YELLOW + ' event: {}'  # 14, "remote"
+}
+
+# infrared event → (log colour, label, sound)
+_IR_SOUND = {
+    Event.INFRARED_PORT: ( _RED,   'port',      Sound.DIT_A ),
+    Event.INFRARED_CNTR: ( _BLUE,  'center',    Sound.DIT_B ),
+    Event.INFRARED_STBD: ( _GREEN, 'starboard', Sound.DIT_C )
+}
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class SoundSubscriber(Subscriber):
     CLASS_NAME = 'sound'
@@ -46,6 +77,7 @@ class SoundSubscriber(Subscriber):
             ])) 
         _cfg = config['krzos'].get('subscriber').get('sound_subscriber')
         self._play_sounds = _cfg.get('play_sounds', False)
+        self._player      = None # resolved on first use so we don't create it early
         self._log.info('ready.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
@@ -63,40 +95,70 @@ class SoundSubscriber(Subscriber):
 #       DWERP EARPIT GLINCE GWOLP HONK HZAH IPPURT ITIZ IZIT PEW_PEW_PEW PIZZLE SKID_FZZT 
 #       SONIC_BAT TELEMETRY TIKA_TIKA TSK_TSK_TSK TICK TWEAK TWIDDLE_POP TWIT WOW ZZT 
 
-        match _event.group:
-            case Group.SYSTEM:      #  1, "system" 
-                self._log.info(Style.DIM + 'SYSTEM: message {}; '.format(message.name) + Fore.YELLOW + ' event: {}'.format(_event.name))
-            case Group.GAMEPAD:     #  3, "gamepad" 
-                self._log.info(Style.DIM + 'GAMEPAD: message {}; '.format(message.name) + Fore.YELLOW + ' event: {}'.format(_event.name))
-            case Group.STOP:        #  4, "stop" 
-                self._log.info(Style.DIM + 'STOP: message {}; '.format(message.name) + Fore.YELLOW + ' event: {}'.format(_event.name))
-            case Group.BUMPER:      #  5, "bumper" 
-                _value = int(message.payload.value)
-                if _value > 0 and self._play_sounds:
-                    self._log.info(Style.BRIGHT + 'BUMPER: message {}; '.format(message.name) + Fore.YELLOW + 'event: {}; '.format(_event.name) + 'value: {}'.format(_value))
-                    Player.instance().play(Sound.HONK)
-            case Group.INFRARED:    #  6, "infrared" 
-                if _event is Event.INFRARED_PORT:
-                    if self._play_sounds:
-                        self._log.info(Fore.RED   + 'port infrared: {:d}mm'.format(int(message.payload.value)))
-                        Player.instance().play(Sound.DIT_A)
-                elif _event is Event.INFRARED_CNTR:
-                    if self._play_sounds:
-                        self._log.info(Fore.BLUE  + 'center infrared: {:d}mm'.format(int(message.payload.value)))
-                        Player.instance().play(Sound.DIT_B)
-                elif _event is Event.INFRARED_STBD:
-                    if self._play_sounds:
-                        self._log.info(Fore.GREEN + 'starboard infrared: {:d}mm'.format(int(message.payload.value)))
-                        Player.instance().play(Sound.DIT_C)
-            case Group.IMU:         #  7, "imu" 
-                self._log.info(Style.DIM + 'IMU: message {}; '.format(message.name) + Fore.YELLOW + ' event: {}'.format(_event.name))
-            case Group.BEHAVIOUR:   # 11, "behaviour" 
-                self._log.info(Style.DIM + 'BEHAVIOUR: message {}; '.format(message.name) + Fore.YELLOW + ' event: {}'.format(_event.name))
-            case Group.REMOTE:      # 14, "remote" 
-                self._log.info(Style.DIM + 'REMOTE: message {}; '.format(message.name) + Fore.YELLOW + ' event: {}'.format(_event.name))
-
-        self._log.debug('pre-processing message {}; '.format(message.name) + Fore.YELLOW + ' event: {}'.format(_event.name))
+        # only build log strings that will actually be emitted
+        _suppressed = self._log.suppressed
+        _log_info   = not _suppressed and self._log.level.value <= Level.INFO.value
+        _log_debug  = not _suppressed and self._log.level.value <= Level.DEBUG.value
+
+        _handler = SoundSubscriber._HANDLERS.get(_event.group)
+        if _handler:
+            await _handler(self, message, _event, _log_info)
+
+        if _log_debug:
+            self._log.debug(_PRE_FORMAT.format(message.name, _event.name))
         await Subscriber.process_message(self, message)
-        self._log.debug('post-processing message {}'.format(message.name))
+        if _log_debug:
+            self._log.debug('post-processing message {}'.format(message.name))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _get_player(self):
+        '''
+        Returns the Player singleton, cached after the first call. This is
+        not fetched in the constructor since the Player may not yet have
+        been created with its TinyFX controller.
+        '''
+        _player = self._player
+        if _player is None:
+            _player = self._player = Player.instance()
+        return _player
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _on_logged(self, message, event, log_info):
+        '''
+        Handles groups that are only logged.
+        '''
+        if log_info:
+            self._log.info(_GROUP_FORMAT[event.group].format(message.name, event.name))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _on_bumper(self, message, event, log_info):
+        '''
+        Honks on a bumper hit, awaiting the sound without blocking the
+        event loop.
+        '''
+        _value = int(message.payload.value)
+        if _value > 0 and self._play_sounds:
+            if log_info:
+                self._log.info(_BUMPER_FORMAT.format(message.name, event.name, _value))
+            await self._get_player().play_async(Sound.HONK)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _on_infrared(self, message, event, log_info):
+        '''
+        Plays a dit sound particular to the infrared sensor, awaiting the
+        sound without blocking the event loop.
+        '''
+        if self._play_sounds:
+            _entry = _IR_SOUND.get(event)
+            if _entry:
+                _color, _label, _sound = _entry
+                if log_info:
+                    self._log.info(_color + _INFRARED_FORMAT.format(_label, int(message.payload.value)))
+                await self._get_player().play_async(_sound)
+
+# message group → handler, one lookup per message
+SoundSubscriber._HANDLERS = dict.fromkeys(_GROUP_FORMAT, SoundSubscriber._on_logged)
+SoundSubscriber._HANDLERS[Group.BUMPER]   = SoundSubscriber._on_bumper   #  5, "bumper"
+SoundSubscriber._HANDLERS[Group.INFRARED] = SoundSubscriber._on_infrared #  6, "infrared"
 
 #EOF
@@ -13,8 +13,7 @@
 import sys, platform
 import os, psutil
 from pathlib import Path
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Level, Logger
 
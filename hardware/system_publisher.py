@@ -22,8 +22,7 @@
 
 import sys
 import asyncio
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import ioexpander as io
 
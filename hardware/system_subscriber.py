@@ -10,8 +10,7 @@
 # modified: 2024-10-31
 #
 
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.logger import Logger, Level
 from core.event import Event, Group
@@ -11,8 +11,7 @@
 #
 # Task class at bottom
 
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 from core.util import Util
 from core.logger import Logger, Level
@@ -14,18 +14,38 @@ import time
 import sys
 import traceback
 import datetime as dt
-from smbus2 import SMBus
-from colorama import init, Fore, Style
-init()
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread
+from smbus2 import SMBus, I2cFunc, i2c_msg
+from colorama import Fore, Style
 
 from core.component import Component
 from core.orientation import Orientation
 from core.logger import Logger, Level
 #from enum import Enum # for Response at bottom of file
-from hardware.response import Response
+from hardware.response import Response, RESPONSE_OKAY, RESPONSE_SKIPPED, RESPONSE_UNKNOWN_ERROR
 
 class TinyFxController(Component):
     NAME = 'tinyfx-ctrl'
+    # the fixed command set, encoded once
+    _PAYLOADS = { _verb: _verb.encode('utf-8') for _verb in (
+            'off', 'on', 'nav', 'port', 'stbd', 'mast', 'pir get', 'pir on', 'pir off',
+            'ram', 'flash', 'help', 'sounds', 'exit') }
+    # commands that only set the light state, so repeating one is a no-op
+    _IDEMPOTENT = frozenset(('off', 'on', 'nav', 'port', 'stbd', 'mast'))
+    _OKAY_VALUE = RESPONSE_OKAY.value
+    # the original controller also accepted 32 as okay; it is not a response code,
+    # and the firmware's multibyte mode sends the response description as ASCII
+    # text plus a CRC with no length prefix, so this is retained only for legacy
+    _LEGACY_OKAY = 32
+    # the command sent by channel_on() for each Orientation
+    _CHANNEL_COMMANDS = {
+            Orientation.NONE: 'off',
+            Orientation.ALL:  'on',
+            Orientation.PORT: 'port',
+            Orientation.STBD: 'stbd',
+            Orientation.MAST: 'mast',
+            Orientation.PIR:  'pir get' }
     '''
     Connects with a Tiny FX over I2C.
     '''
@@ -36,9 +56,21 @@ class TinyFxController(Component):
         _cfg = config['krzos'].get('hardware').get('tinyfx-controller')
         self._i2c_address        = _cfg.get('i2c_address')
         self._bus_number         = _cfg.get('bus_number')
+        self._ready_timeout      = _cfg.get('ready_timeout', 1.0)
         self._i2cbus             = None
+        self._i2c_rdwr           = None # bound SMBus methods, set on enable
+        self._write_block        = None
+        self._read_byte          = None
+        self._read_msg           = None # reusable one byte response message
+        self._transfer           = self._transfer_i2c
         self._config_register    = 1
+        self._completion_code    = 0xFF
+        self._trailer            = bytes((self._config_register, self._completion_code))
         self._max_payload_length = 32
+        self._last_command       = None # last light state command acknowledged
+        self._lock               = Lock() # serialises send_data() between callers and the writer
+        self._queue              = SimpleQueue() # commands posted for the writer thread
+        self._writer             = None
         self._last_send_time = None  # timestamp of last send
         self._min_send_interval = dt.timedelta(milliseconds=100)  # 100ms minimum send interval
         self._log.info('ready.')
@@ -50,19 +82,66 @@ class TinyFxController(Component):
         an OKAY response.
         '''
         Component.enable(self)
+        # the TinyFX may have been reset since we last saw it
+        self._last_command = None
         try:
             self._i2cbus = SMBus(self._bus_number)
-            _response = self.send_data('off')
-            time.sleep(1) # otherwise the RP2040 will end up using both cores
-            if _response is Response.OKAY:
-                self._log.info('enabled; response: ' + Fore.GREEN + '{}'.format(_response.name))
+            if self._i2cbus.funcs & I2cFunc.I2C:
+                self._i2c_rdwr = self._i2cbus.i2c_rdwr
+                self._read_msg = i2c_msg.read(self._i2c_address, 1)
+                self._transfer = self._transfer_i2c
+                self._max_payload_length = 32
             else:
-                raise Exception('tinyfx not enabled; response was not okay: ' + Fore.RED + '{}'.format(_response.name))
+                self._log.warning('i2c adapter does not support combined transfers; using smbus transfers.')
+                self._write_block = self._i2cbus.write_i2c_block_data
+                self._read_byte   = self._i2cbus.read_byte_data
+                self._transfer = self._transfer_smbus
+                # an SMBus block is at most 32 bytes, including the length and trailer
+                self._max_payload_length = 32 - 1 - len(self._trailer)
+            _response = self._await_ready()
+            if _response == RESPONSE_OKAY:
+                if self._writer is None:
+                    self._writer = Thread(name='tinyfx-writer', target=self._writer_loop, daemon=True)
+                    self._writer.start()
+                self._log.info('enabled; response: ' + Fore.GREEN + '{}'.format(_response.description))
+            else:
+                raise Exception('tinyfx not enabled; response was not okay: ' + Fore.RED + '{}'.format(_response.description))
         except Exception as e:
             self._log.error('{} raised could not connect to tinyfx: {}'.format(type(e), e))
             # disable if error occurs or TinyFX is unavailable
             Component.disable(self)
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _await_ready(self):
+        '''
+        Sends 'off' until the TinyFX responds OKAY or the ready timeout
+        elapses, backing off exponentially between attempts, returning the
+        last Response. Polling rather than sleeping for the worst case cuts
+        startup latency when the TinyFX is ready promptly.
+
+        The probe bypasses send_data(), so neither the light state cache nor
+        the minimum send interval applies, and only the final response is
+        logged. A transport error, e.g., no TinyFX on the bus, is raised on
+        the first attempt rather than retried.
+        '''
+        _payload  = TinyFxController._PAYLOADS['off']
+        _okay     = ( TinyFxController._OKAY_VALUE, TinyFxController._LEGACY_OKAY )
+        _timeout  = self._ready_timeout
+        _start    = time.monotonic()
+        _attempt  = 0
+        while True:
+            with self._lock:
+                _read_data = self._transfer(_payload)
+                self._last_send_time = dt.datetime.now()
+            if _read_data in _okay or time.monotonic() - _start >= _timeout:
+                break
+            time.sleep(min(0.05, 0.001 * (2 ** _attempt)))
+            _attempt += 1
+        _response = self._read_response(_read_data)
+        if _response == RESPONSE_OKAY:
+            self._last_command = 'off'
+        return _response
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def help(self):
         '''
@@ -71,17 +150,23 @@ class TinyFxController(Component):
         self.send_data('help')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def play(self, key):
+    def play(self, key, wait=True):
         '''
         A convenience method to play the sound corresponding to the key,
-        returning the Response.
+        returning the Response. If wait is False the command is posted to
+        the writer thread and None is returned.
         '''
+        _suppressed = self._log.suppressed
         if key.startswith('play '):
-            self._log.info("> '{}'".format(key))
-            return self.send_data(key)
+            if not _suppressed and self._log.level.value <= Level.INFO.value:
+                self._log.info("> '{}'".format(key))
         else:
-            self._log.debug("play: '{}'".format(key))
-            return self.send_data('play {}'.format(key))
+            if not _suppressed and self._log.level.value <= Level.DEBUG.value:
+                self._log.debug("play: '{}'".format(key))
+            key = 'play ' + key
+        if wait:
+            return self.send_data(key)
+        self.post(key)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def channel_on(self, orientation):
@@ -94,19 +179,11 @@ class TinyFxController(Component):
             Orientation.STBD :  turn on starboard light
             Orientation.MAST :  turn on mast flashing light
         '''
-        match orientation:
-            case Orientation.NONE:
-                return self.send_data('off')
-            case Orientation.ALL:
-                return self.send_data('on')
-            case Orientation.PORT:
-                return self.send_data('port')
-            case Orientation.STBD:
-                return self.send_data('stbd')
-            case Orientation.MAST:
-                return self.send_data('mast')
-            case Orientation.PIR:
-                return self.send_data('pir get')
+        _command = TinyFxController._CHANNEL_COMMANDS.get(orientation)
+        if _command is None:
+            self._log.warning('unsupported orientation: {}'.format(orientation))
+            return None
+        return self.send_data(_command)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def on(self):
@@ -116,6 +193,15 @@ class TinyFxController(Component):
         self._log.info('lights on…')
         return self.channel_on(Orientation.ALL)
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def nav(self):
+        '''
+        A shortcut that turns on both the port and starboard running lights
+        in a single command, returning the Response.
+        '''
+        self._log.info('navigation lights on…')
+        return self.send_data('nav')
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def off(self):
         '''
@@ -163,13 +249,58 @@ class TinyFxController(Component):
         '''
         return self.send_data('exit')
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def post(self, data):
+        '''
+        Queue a string of data to be sent over I2C by the writer thread,
+        returning immediately. The Response is only logged. Repeated light
+        state commands are still dropped by send_data().
+        '''
+        if not self.enabled:
+            raise Exception('not enabled.')
+        self._queue.put(data)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _writer_loop(self):
+        '''
+        Sends posted commands in order until a None is posted. Rather than
+        have send_data() skip a command that arrives within the minimum send
+        interval, the writer waits out the remainder of the interval. The
+        wait is made holding the lock so that a direct send_data() cannot
+        slip in and restart the interval.
+        '''
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            try:
+                with self._lock:
+                    _last_send_time = self._last_send_time
+                    if _last_send_time:
+                        _wait = (_last_send_time + self._min_send_interval - dt.datetime.now()).total_seconds()
+                        if _wait > 0:
+                            time.sleep(_wait)
+                    self._send_data(data)
+            except Exception as e:
+                self._log.error("{} raised posting '{}': {}".format(type(e), data, e))
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def send_data(self, data):
         '''
-        Send a string of data over I2C, returning the Response.
+        Send a string of data over I2C, returning the Response. This blocks
+        for the I2C transaction; use post() to send without waiting.
         '''
+        with self._lock:
+            return self._send_data(data)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _send_data(self, data):
         if not self.enabled:
             raise Exception('not enabled.')
+        if data == self._last_command:
+            if not self._log.suppressed and self._log.level.value <= Level.DEBUG.value:
+                self._log.debug("'{}' already set, not sent.".format(data))
+            return RESPONSE_SKIPPED
         now = dt.datetime.now()
         if self._last_send_time:
             elapsed = now - self._last_send_time
@@ -183,16 +314,29 @@ class TinyFxController(Component):
                 return Response.SKIPPED
         try:
             payload = self._convert_to_payload(data)
-            self._log.info("send payload '{}' as data: '{}'".format(payload, data))
-            self._write_payload(payload)
-            self._write_completion_code()
-            _response = self._read_response()
+            if not self._log.suppressed and self._log.level.value <= Level.INFO.value:
+                self._log.info("send payload '{}' as data: '{}'".format(payload, data))
+            _idempotent = data in TinyFxController._IDEMPOTENT
+            if _idempotent:
+                self._last_command = None # light state unknown until acknowledged
+            _read_data = self._transfer(payload)
+            _response = self._read_response(_read_data)
+            if _response == RESPONSE_OKAY:
+                if _idempotent:
+                    self._last_command = data
+            else:
+                # an error may mean the TinyFX was reset, so its light state is unknown
+                self._last_command = None
             return _response
         except TimeoutError as te:
+            self._last_command = None
             self._log.error("transfer timeout: {}".format(te))
             return Response.CONNECTION_ERROR
         except Exception as e:
-            self._log.error('{} thrown sending data to tiny fx: {}\n{}'.format(type(e), e, traceback.format_exc()))
+            self._last_command = None
+            # only format the traceback if the error will actually be logged
+            if not self._log.suppressed and self._log.level.value <= Level.ERROR.value:
+                self._log.error('{} thrown sending data to tiny fx: {}\n{}'.format(type(e), e, traceback.format_exc()))
         finally:
             self._last_send_time = now # update only upon success or error
 
@@ -201,51 +345,83 @@ class TinyFxController(Component):
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def _convert_to_payload(self, data):
         '''
-        Convert the string to a payload suitable for I2C transfer.
+        Convert the string to a bytes payload suitable for I2C transfer. The
+        fixed commands are pre-encoded.
         '''
-        payload = list(bytes(data, "utf-8"))
+        payload = TinyFxController._PAYLOADS.get(data)
+        if payload is not None:
+            return payload
+        payload = data.encode('utf-8')
         if len(payload) > self._max_payload_length:
             raise ValueError(f"Source text ({len(payload)} chars) too long: {self._max_payload_length} maximum.")
         return payload
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def _write_payload(self, payload):
+    def _transfer_i2c(self, payload):
         '''
-        Write the payload to the I2C bus.
+        Write the payload and the completion code to the I2C bus and read
+        back the one byte response, as a single combined transaction (one
+        ioctl, with a repeated start between the write and the read). The
+        bytes written are those of a block write of the payload followed by
+        a byte write of the completion code, i.e.,
+
+            [ register, length, payload…, register, completion code ]
+
+        Returns the response byte.
         '''
         if payload is None:
             raise TypeError('null payload.')
-        self._i2cbus.write_block_data(self._i2c_address, self._config_register, payload)
+        _write = i2c_msg.write(self._i2c_address,
+                bytes((self._config_register, len(payload))) + payload + self._trailer)
+        _read = self._read_msg
+        self._i2c_rdwr(_write, _read)
+        return ord(_read.buf[0])
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def _write_completion_code(self):
+    def _transfer_smbus(self, payload):
         '''
-        Write a completion code to the I2C bus.
+        The fallback for I2C adapters that only support SMBus transactions:
+        writes the same bytes as _transfer_i2c() as one I2C block write, then
+        reads the one byte response in a separate transaction.
+
+        Returns the response byte.
         '''
-        self._log.debug("writing completion code…")
-        self._i2cbus.write_byte_data(self._i2c_address, self._config_register, 0xFF)
-        self._log.debug("write complete.")
+        if payload is None:
+            raise TypeError('null payload.')
+        self._write_block(self._i2c_address, self._config_register,
+                bytes((len(payload),)) + payload + self._trailer)
+        return self._read_byte(self._i2c_address, self._config_register)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def _read_response(self):
+    def _read_response(self, read_data):
         '''
-        Read the response from the I2C device.
+        Convert the byte read from the I2C device to a Response.
         '''
-        read_data = self._i2cbus.read_byte_data(self._i2c_address, self._config_register)
-        response = Response.from_value(read_data)
-        self._log.info("read data: '{}' as response: {}".format(read_data, response))
-        if response.value <= Response.OKAY.value:
-            self._log.info("tinyfx response: {}".format(response.name))
-        elif read_data == 32:
+        if read_data == TinyFxController._OKAY_VALUE or read_data == TinyFxController._LEGACY_OKAY:
             self._log.info("tinyfx response: okay")
-        else:
-            self._log.error("tinyfx response: {}; data: 0x{:02X}".format(response.name, read_data))
+            return RESPONSE_OKAY
+        response = Response.from_value(read_data)
+        if response is None:
+            self._log.error("tinyfx response: unrecognised; data: 0x{:02X}".format(read_data))
+            return RESPONSE_UNKNOWN_ERROR
+        self._log.error("tinyfx response: {}; data: 0x{:02X}".format(response.description, read_data))
         return response
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def close(self):
+        if self._writer is not None:
+            # discard any backlog so the writer stops after its current send
+            try:
+                while True:
+                    self._queue.get_nowait()
+            except Empty:
+                pass
+            self._queue.put(None)
+            self._writer.join() # the bus must not be closed under the writer
+            self._writer = None
         self.send_data('off')
         self._i2cbus.close()
+        self._last_command = None
         self._log.info('closed.')
 
 #EOF
@@ -12,8 +12,7 @@
 
 import traceback
 import signal
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
 
 import VL53L1X
 #from VL53L1X import VL53L1xDistanceMode
@@ -17,6 +17,7 @@
 #
 
 import os, sys, signal, time, traceback
+import gc
 import argparse
 import itertools
 from pathlib import Path
@@ -374,13 +375,14 @@ class KRZOS(Component, FiniteStateMachine):
         if self._tinyfx: # turn on running lights
             _cfg = self._config.get('krzos').get('hardware').get('tinyfx-controller')
             _enable_mast_light = _cfg.get('enable_mast_light')
-            if _enable_mast_light:
-                self._tinyfx.channel_on(Orientation.MAST)
             _enable_nav_light = _cfg.get('enable_nav_lights')
-            if _enable_nav_light:
-                self._tinyfx.channel_on(Orientation.PORT)
-                time.sleep(0.1)
-                self._tinyfx.channel_on(Orientation.STBD)
+            # one command per case, as back-to-back sends fall within the minimum send interval
+            if _enable_mast_light and _enable_nav_light:
+                self._tinyfx.on()
+            elif _enable_nav_light:
+                self._tinyfx.nav()
+            elif _enable_mast_light:
+                self._tinyfx.channel_on(Orientation.MAST)
 
         PigpiodUtility.ensure_pigpiod_is_running()
 
@@ -406,6 +408,8 @@ class KRZOS(Component, FiniteStateMachine):
         # ════════════════════════════════════════════════════════════════════
         # now in main application loop until quit or Ctrl-C…
         self._started = True
+        # move the objects created during setup out of the collector's view
+        gc.freeze()
         self._log.info('enabling message bus…')
         self._message_bus.enable()
         # that blocks so we never get here until the end…
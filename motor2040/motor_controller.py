@@ -12,6 +12,8 @@
 
 import sys
 import utime
+from array import array
+import micropython
 from math import ceil as ceiling
 from machine import Timer
 import uasyncio as asyncio
@@ -31,6 +33,10 @@ class MotorController(Controller):
     PAFT = 2
     SAFT = 3
     DEFAULT_SPEED = 0.5 # if speed is not specified on motor commands
+    # per-motor speed signs, in motor id order (PFWD, SFWD, PAFT, SAFT)
+    ALL_SIGNS     = ( 1.0,  1.0,  1.0,  1.0)
+    CRAB_SIGNS    = ( 1.0, -1.0, -1.0,  1.0)
+    ROTATE_SIGNS  = (-1.0,  1.0, -1.0,  1.0) # positive is counter-clockwise
     '''
     A motor controller for four motors.
 
@@ -47,20 +53,18 @@ class MotorController(Controller):
         self._motor_sfwd = Motor(motor2040.MOTOR_B, direction=MotorController.REVERSED_DIR)
         self._motor_paft = Motor(motor2040.MOTOR_C, direction=MotorController.NORMAL_DIR)
         self._motor_saft = Motor(motor2040.MOTOR_D, direction=MotorController.REVERSED_DIR)
+        # fixed tuple of all motors, indexed by motor id (PFWD, SFWD, PAFT, SAFT)
+        self._motors = (self._motor_pfwd, self._motor_sfwd, self._motor_paft, self._motor_saft)
+        # bound speed methods, resolved once since the motor set is fixed
+        self._speed_fns = tuple(_motor.speed for _motor in self._motors)
 
         self._motor_pfwd.speed_scale(1.5) # this motor is a bit slow
 
-        self._motor_pfwd_scale = self._motor_pfwd.speed_scale()
-        self._motor_sfwd_scale = self._motor_sfwd.speed_scale()
-        self._motor_paft_scale = self._motor_paft.speed_scale()
-        self._motor_saft_scale = self._motor_saft.speed_scale()
-#       self._log.info("speed scale; pfwd: '{}'; sfwd: '{}'; paft: '{}'; saft: '{}'".format(self._motor_pfwd_scale, self._motor_sfwd_scale, self._motor_paft_scale, self._motor_saft_scale))
-
-        self._motor_pfwd_zeropoint = self._motor_pfwd.zeropoint()
-        self._motor_sfwd_zeropoint = self._motor_sfwd.zeropoint()
-        self._motor_paft_zeropoint = self._motor_paft.zeropoint()
-        self._motor_saft_zeropoint = self._motor_saft.zeropoint()
-#       self._log.info("zero point; pfwd: '{}'; sfwd: '{}'; paft: '{}'; saft: '{}'".format(self._motor_pfwd_zeropoint, self._motor_sfwd_zeropoint, self._motor_paft_zeropoint, self._motor_saft_zeropoint))
+        # per-motor configuration, one tuple per field indexed by motor id
+        self._scales     = tuple(_motor.speed_scale() for _motor in self._motors)
+        self._zeropoints = tuple(_motor.zeropoint() for _motor in self._motors)
+#       self._log.info("speed scale; pfwd: '{}'; sfwd: '{}'; paft: '{}'; saft: '{}'".format(*self._scales))
+#       self._log.info("zero point; pfwd: '{}'; sfwd: '{}'; paft: '{}'; saft: '{}'".format(*self._zeropoints))
 
         # motor.deadzone(deadzone)
         # _deadzone = motor.deadzone() # default 0.05
@@ -69,14 +73,41 @@ class MotorController(Controller):
 #       self._motor_paft.zeropoint(0.0)
 #       self._motor_saft.zeropoint(0.0)
 
-        self._motor_pfwd_speed   = 0.0
-        self._motor_sfwd_speed   = 0.0 
-        self._motor_paft_speed   = 0.0
-        self._motor_saft_speed   = 0.0
+        # current speeds as one contiguous float array, indexed by motor id (PFWD, SFWD, PAFT, SAFT)
+        self._speeds             = array('f', (0.0, 0.0, 0.0, 0.0))
         self._acceleration_delay = 0.08  # for acceleration or any loops
         self._deceleration_delay = 0.15  # for acceleration or any loops
         self._delta              = 0.020 # iterative delta
         self._processing_task    = None
+        # command dispatch tables, keyed by exact command or four character prefix
+        self._exact_commands = {
+            'red':         lambda: self.show_color(COLOR_RED),
+            'green':       lambda: self.show_color(COLOR_GREEN),
+            'blue':        lambda: self.show_color(COLOR_BLUE),
+            'cyan':        lambda: self.show_color(COLOR_CYAN),
+            'magenta':     lambda: self.show_color(COLOR_MAGENTA),
+            'yellow':      lambda: self.show_color(COLOR_YELLOW),
+            'black':       lambda: self.show_color(COLOR_BLACK),
+            'start-timer': self.startTimer,
+            'stop-timer':  self.stopTimer
+        }
+        self._prefix_commands = {
+            'help': self.help,
+            'enab': self.enable,
+            'disa': self.disable,
+            'stop': self.stop,
+            'coas': self.coast,
+            'brak': self.brake,
+            'slow': self.slow_decay,
+            'fast': self.fast_decay,
+            'dece': self.decelerate
+        }
+        # commands taking a single speed argument
+        self._speed_commands = {
+            'acce': self.accelerate,
+            'crab': self.crab,
+            'rota': self.rotate
+        }
         self._log.info('ready.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
@@ -111,54 +142,14 @@ class MotorController(Controller):
             else:
                 # parse command into arguments
                 command, _port_speed, _stbd_speed, _duration = self.parse_command(command)
-                if command.startswith('help'):
-                    self.help()
-                elif command.startswith('enab'):
-                    self.enable()
-                elif command.startswith('disa'):
-                    self.disable()
-                elif command.startswith('stop'):
-                    self.stop()
-                elif command.startswith('coas'):
-                    self.coast()
-                elif command.startswith('brak'):
-                    self.brake()
-                elif command.startswith('slow'):
-                    self.slow_decay()
-                elif command.startswith('fast'):
-                    self.fast_decay()
-                elif command.startswith('acce'):
-                    self.accelerate(_port_speed)
-                elif command.startswith('dece'):
-                    self.decelerate(0.0)
+                _prefix = command[:4]
+                _fn = self._exact_commands.get(command) or self._prefix_commands.get(_prefix)
+                if _fn:
+                    _fn()
+                elif _prefix in self._speed_commands:
+                    self._speed_commands[_prefix](_port_speed)
                 elif command.startswith('go'):
                     self.go(_port_speed, _stbd_speed)
-                elif command.startswith('crab'):
-                    self.crab(_port_speed)
-                elif command.startswith('rota'):
-                    self.rotate(_port_speed)
-
-                # set some colors ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-                elif command == 'red':
-                    self.show_color(COLOR_RED)
-                elif command == 'green':
-                    self.show_color(COLOR_GREEN)
-                elif command == 'blue':
-                    self.show_color(COLOR_BLUE)
-                elif command == 'cyan':
-                    self.show_color(COLOR_CYAN)
-                elif command == 'magenta':
-                    self.show_color(COLOR_MAGENTA)
-                elif command == 'yellow':
-                    self.show_color(COLOR_YELLOW)
-                elif command == 'black':
-                    self.show_color(COLOR_BLACK)
-
-                # start and stop a timer ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-                elif command == 'start-timer':
-                    self.startTimer()
-                elif command == 'stop-timer':
-                    self.stopTimer()
                 else:
                     # delegate to base class if not processed ┈┈┈┈┈┈┈┈
                     await super().handle_command(command)
@@ -196,15 +187,14 @@ class MotorController(Controller):
         # parse optional arguments if present
         try:
             _port_speed = float(parts[1]) if len(parts) > 1 else DEFAULT_SPEED
-            _stbd_speed = float(parts[2]) if len(parts) > 2 else DEFAULT_SPEED
+            # an omitted starboard speed follows the port speed
+            _stbd_speed = float(parts[2]) if len(parts) > 2 else _port_speed
             _duration   = float(parts[3]) if len(parts) > 3 else DEFAULT_DURATION
         except ValueError:
             raise ValueError("Command arguments must be valid float values")
-        # validate ranges
-        if not -1.0 <= _port_speed <= 1.0:
-            raise ValueError("port speed out of range (-1.0 to 1.0)")
-        if not -1.0 <= _stbd_speed <= 1.0:
-            raise ValueError("starboard speed out of range (-1.0 to 1.0)")
+        # validate ranges, both speeds in one test
+        if min(_port_speed, _stbd_speed) < -1.0 or max(_port_speed, _stbd_speed) > 1.0:
+            raise ValueError("speed out of range (-1.0 to 1.0); port: {}; stbd: {}".format(_port_speed, _stbd_speed))
         if not 0.0 <= _duration <= 99.0:
             raise ValueError("duration out of range (0.0 to 99.0)")
         return _command, _port_speed, _stbd_speed, _duration
@@ -259,71 +249,57 @@ motor controller commands:
     # motor control ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
     def motor_enable(self):
-        self._motor_pfwd.enable()
-        self._motor_sfwd.enable()
-        self._motor_paft.enable()
-        self._motor_saft.enable()
+        for _motor in self._motors:
+            _motor.enable()
         self._log.info('enabled.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def motor_disable(self):
-        self._motor_pfwd.disable()
-        self._motor_sfwd.disable()
-        self._motor_paft.disable()
-        self._motor_saft.disable()
+        for _motor in self._motors:
+            _motor.disable()
         self._log.info('disabled.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def stop(self):
         self._log.info('stop.')
-        self._motor_pfwd.stop()
-        self._motor_sfwd.stop()
-        self._motor_paft.stop()
-        self._motor_saft.stop()
-        self._motor_pfwd_speed = 0.0
-        self._motor_sfwd_speed = 0.0
-        self._motor_paft_speed = 0.0
-        self._motor_saft_speed = 0.0
+        for _motor in self._motors:
+            _motor.stop()
+        self._clear_speeds()
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def coast(self):
         self._log.info('coast.')
-        self._motor_pfwd.coast()
-        self._motor_sfwd.coast()
-        self._motor_paft.coast()
-        self._motor_saft.coast()
-        self._motor_pfwd_speed = 0.0
-        self._motor_sfwd_speed = 0.0
-        self._motor_paft_speed = 0.0
-        self._motor_saft_speed = 0.0
+        for _motor in self._motors:
+            _motor.coast()
+        self._clear_speeds()
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def brake(self):
         self._log.info('brake.')
-        self._motor_pfwd.brake()
-        self._motor_sfwd.brake()
-        self._motor_paft.brake()
-        self._motor_saft.brake()
-        self._motor_pfwd_speed = 0.0
-        self._motor_sfwd_speed = 0.0
-        self._motor_paft_speed = 0.0
-        self._motor_saft_speed = 0.0
+        for _motor in self._motors:
+            _motor.brake()
+        self._clear_speeds()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _clear_speeds(self):
+        '''
+        Zeroes the recorded speeds in place, keeping the same array.
+        '''
+        _speeds = self._speeds
+        for _id in range(4):
+            _speeds[_id] = 0.0
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def slow_decay(self):
         self._log.info('set slow-decay mode.')
-        self._motor_pfwd.decay_mode(SLOW_DECAY)
-        self._motor_sfwd.decay_mode(SLOW_DECAY)
-        self._motor_paft.decay_mode(SLOW_DECAY)
-        self._motor_saft.decay_mode(SLOW_DECAY)
+        for _motor in self._motors:
+            _motor.decay_mode(SLOW_DECAY)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def fast_decay(self):
         self._log.info('set fast-decay mode.')
-        self._motor_pfwd.decay_mode(FAST_DECAY)
-        self._motor_sfwd.decay_mode(FAST_DECAY)
-        self._motor_paft.decay_mode(FAST_DECAY)
-        self._motor_saft.decay_mode(FAST_DECAY)
+        for _motor in self._motors:
+            _motor.decay_mode(FAST_DECAY)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def accelerate(self, speed=DEFAULT_SPEED):
@@ -332,13 +308,14 @@ motor controller commands:
         speed of all motors is zero.
         '''
         self._log.info('accelerate to speed: {}.'.format(speed))
+        _set_speeds = self.set_speeds
+        _delay = self._acceleration_delay
+        _debug = self._log.is_at_least(Level.DEBUG) # skip per-step formatting unless logged
         for _speed in MotorController._frange(0.0, speed, self._delta):
-            self._log.debug('> speed: {}'.format(_speed))
-            self.set_speed(MotorController.PFWD, _speed)
-            self.set_speed(MotorController.SFWD, _speed)
-            self.set_speed(MotorController.PAFT, _speed)
-            self.set_speed(MotorController.SAFT, _speed)
-            utime.sleep(self._acceleration_delay)
+            if _debug:
+                self._log.debug('> speed: {}'.format(_speed))
+            _set_speeds(_speed, _speed, _speed, _speed)
+            utime.sleep(_delay)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def decelerate(self, target_speed=0.0):
@@ -347,16 +324,16 @@ motor controller commands:
         unspecified the default is zero). This assumes all motors are
         currently operating at the same speed (we use PFWD as the exemplar).
         '''
-#       self._log.info("decel speeds; pfwd: '{:.2f}'; sfwd: '{:.2f}'; paft: '{:.2f}'; saft: '{:.2f}'".format(self._motor_pfwd_speed, self._motor_sfwd_speed, self._motor_paft_speed, self._motor_saft_speed))
-        _current_speed = self._motor_pfwd_speed # we just choose one arbitrarily
-        self._log.info('decelerate from current speed {:.2f} to target speed {:.2f} with delta {:.2f}.'.format(_current_speed, target_speed, (-1.0 * self._delta)))
-        for _speed in MotorController._frange(_current_speed, target_speed, -1.0 * self._delta):
+#       self._log.info("decel speeds; pfwd: '{:.2f}'; sfwd: '{:.2f}'; paft: '{:.2f}'; saft: '{:.2f}'".format(*self._speeds))
+        _current_speed = self._speeds[MotorController.PFWD] # we just choose one arbitrarily
+        _step = -self._delta
+        self._log.info('decelerate from current speed {:.2f} to target speed {:.2f} with delta {:.2f}.'.format(_current_speed, target_speed, _step))
+        _set_speeds = self.set_speeds
+        _delay = self._deceleration_delay
+        for _speed in MotorController._frange(_current_speed, target_speed, _step):
 #           self._log.info('decelerate _speed: {}.'.format(_speed))
-            self.set_speed(MotorController.PFWD, _speed)
-            self.set_speed(MotorController.SFWD, _speed)
-            self.set_speed(MotorController.PAFT, _speed)
-            self.set_speed(MotorController.SAFT, _speed)
-            utime.sleep(self._deceleration_delay)
+            _set_speeds(_speed, _speed, _speed, _speed)
+            utime.sleep(_delay)
         # just to be safe, end at stopped
 #       self._log.info('calling stop from decel.')
         self.stop()
@@ -364,73 +341,72 @@ motor controller commands:
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def all(self, speed=DEFAULT_SPEED):
         self._log.info('all: speed={}.'.format(speed))
-        self.set_speed(MotorController.PFWD, speed)
-        self.set_speed(MotorController.SFWD, speed)
-        self.set_speed(MotorController.PAFT, speed)
-        self.set_speed(MotorController.SAFT, speed)
+        self._set_signed_speed(MotorController.ALL_SIGNS, speed)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def go(self, port_speed=DEFAULT_SPEED, stbd_speed=DEFAULT_SPEED):
         self._log.info('go: port speed={}; stbd speed: {}.'.format(port_speed, stbd_speed))
-        self.set_speed(MotorController.PFWD, port_speed)
-        self.set_speed(MotorController.SFWD, stbd_speed)
-        self.set_speed(MotorController.PAFT, port_speed)
-        self.set_speed(MotorController.SAFT, stbd_speed)
+        self.set_speeds(port_speed, stbd_speed, port_speed, stbd_speed)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def crab(self, speed=DEFAULT_SPEED):
         self._log.info('crab: speed={}.'.format(speed))
-        self.set_speed(MotorController.PFWD, speed)
-        self.set_speed(MotorController.SFWD, -1.0 * speed)
-        self.set_speed(MotorController.PAFT, -1.0 * speed)
-        self.set_speed(MotorController.SAFT, speed)
+        self._set_signed_speed(MotorController.CRAB_SIGNS, speed)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def rotate(self, speed=DEFAULT_SPEED):
         self._log.info('rotate: speed={}.'.format(speed))
-        # positive is counter-clockwise
-        self.set_speed(MotorController.PFWD, -1.0 * speed)
-        self.set_speed(MotorController.SFWD, speed)
-        self.set_speed(MotorController.PAFT, -1.0 * speed)
-        self.set_speed(MotorController.SAFT, speed)
+        self._set_signed_speed(MotorController.ROTATE_SIGNS, speed)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _set_signed_speed(self, signs, speed):
+        '''
+        Sets each motor to the speed multiplied by its sign from the
+        provided tuple, which is in motor id order.
+        '''
+        self.set_speeds(signs[0] * speed, signs[1] * speed, signs[2] * speed, signs[3] * speed)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def get_speed(self, motor_id):
-        if motor_id == MotorController.PFWD:
-            return self._motor_pfwd_speed
-        elif motor_id == MotorController.SFWD:
-            return self._motor_sfwd_speed
-        elif motor_id == MotorController.PAFT:
-            return self._motor_paft_speed
-        elif motor_id == MotorController.SAFT:
-            return self._motor_saft_speed
-        else:
+        if not 0 <= motor_id <= MotorController.SAFT:
             raise ValueError("unrecognised motor id '{}'".format(motor_id))
+        return self._speeds[motor_id]
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @micropython.native
+    def set_speeds(self, pfwd_speed, sfwd_speed, paft_speed, saft_speed):
+        '''
+        Sets the speeds of all four motors in one call, without the per-motor
+        id dispatch of set_speed().
+        '''
+        _speeds = self._speeds
+        _speeds[0] = pfwd_speed
+        _speeds[1] = sfwd_speed
+        _speeds[2] = paft_speed
+        _speeds[3] = saft_speed
+        _pfwd, _sfwd, _paft, _saft = self._speed_fns
+        _pfwd(pfwd_speed)
+        _sfwd(sfwd_speed)
+        _paft(paft_speed)
+        _saft(saft_speed)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @micropython.native
     def set_speed(self, motor_id, speed):
-        if motor_id == MotorController.PFWD:
-#           self._log.info('pfwd motor set to {:4.2f}'.format(speed))
-            self._motor_pfwd_speed = speed
-            self._motor_pfwd.speed(speed)
-        elif motor_id == MotorController.SFWD:
-#           self._log.info('sfwd motor set to {:4.2f}'.format(speed))
-            self._motor_sfwd_speed = speed
-            self._motor_sfwd.speed(speed)
-        elif motor_id == MotorController.PAFT:
-#           self._log.info('paft motor set to {:4.2f}'.format(speed))
-            self._motor_paft_speed = speed
-            self._motor_paft.speed(speed)
-        elif motor_id == MotorController.SAFT:
-#           self._log.info('saft motor set to {:4.2f}'.format(speed))
-            self._motor_saft_speed = speed
-            self._motor_saft.speed(speed)
-        else:
+        '''
+        Sets the speed of the motor with the provided id, indexing directly
+        into the speed method tuple and speed list rather than testing each id.
+        '''
+        if not 0 <= motor_id <= MotorController.SAFT:
             raise ValueError("unrecognised motor id '{}'".format(motor_id))
+#       self._log.info('motor {} set to {:4.2f}'.format(motor_id, speed))
+        self._speeds[motor_id] = speed
+        self._speed_fns[motor_id](speed)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
     @staticmethod
+    @micropython.native
     def _frange(start=0.0, stop=1.0, step=0.1):
         if step == 0:
             raise ValueError("step argument cannot be zero.")
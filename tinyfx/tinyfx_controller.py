@@ -103,6 +103,9 @@ class TinyFxController(Controller):
                 self.stbd_trio_fx.on()
             elif command == 'ch6' or command == 'port':
                 self.port_trio_fx.on()
+            elif command == 'nav':
+                self.port_trio_fx.on()
+                self.stbd_trio_fx.on()
             elif command == 'on':
                 self.blink_fx.on()
                 self.port_trio_fx.on()
@@ -223,6 +226,7 @@ tinyfx controller commands:
     ch4 | mast        turn on mast LED (channel 4)
     ch5 | stbd        turn on starboard running lights (channel 5)
     ch6 | port        turn on port running lights (channel 6)
+    nav               turn on port and starboard running lights
     help              prints this help
     enable            enable controller
     disable           disable and exit the controller
@@ -34,9 +34,11 @@
 # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
 import sys, traceback
-import time, datetime
+import time
+import queue
+from threading import Thread
 import re
-import statistics
+from bisect import bisect_left
 import numpy as np
 from colorama import init, Fore, Style
 init()
@@ -56,13 +58,21 @@ if not pi.connected:
 
 # constants ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
-LIMIT      = [ 200, 300, 400, 500, 1000, 2000, 3000, 4000 ] # mm limits of ea display category
-DOTS       = [ " ⚪ ", " 🔴 ", " 🟠 ", " 🟡 ", " 🟢 ", " 🔵 ", " 🟣 ", " 🟤 ", " ⚫ " ]
+LIMIT      = ( 200, 300, 400, 500, 1000, 2000, 3000, 4000 ) # mm limits of ea display category
+DOTS       = ( " ⚪ ", " 🔴 ", " 🟠 ", " 🟡 ", " 🟢 ", " 🔵 ", " 🟣 ", " 🟤 ", " ⚫ " )
 VERBOSE    = True
 ROWS       = 60           # the number of rows to scroll
 NNNN       = '\n' * ROWS  # as tall as your screen
 MIN_DISTANCE_MM = 1000    # permit targeting if greater than this distance
 FG_COLOR   = Fore.BLUE
+HEADER     = ( FG_COLOR + "  {:07d}   "
+               + Fore.RED + "PORT"
+               + FG_COLOR + "     0     1     2     3     4     5     6     7     "
+               + Fore.GREEN + "STBD \n" + FG_COLOR )
+ROW_FORMAT    = "                    {}  {}  {}  {}  {}  {}  {}  {} \n"
+TARGET_FORMAT = "        target:     {}  {}  {}  {}  {}  {}  {}  {}"
+LIMIT_ARR  = np.array(LIMIT, dtype=np.int32)
+DOTS_ARR   = np.array(DOTS, dtype=object)
 
 # variables ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
@@ -75,68 +85,63 @@ indexMax   = 0
 startTime  = 0
 
 COLS, ROWS = 8, 8
-matrix     = np.array([[0 for x in range(COLS)] for y in range(ROWS)])
-mean       = [0 for x in range(COLS)]
-ikon       = [[0 for x in range(COLS)] for y in range(ROWS)]
-maxDot     = np.array([DOTS[8] for x in range(COLS)], dtype=object)
+matrix     = np.zeros((ROWS, COLS), dtype=int)
+meanArr    = np.zeros(COLS)  # rounded column means, computed once per frame
+colMin     = np.zeros(COLS, dtype=int) # column minimums, computed once per frame
+colMax     = np.zeros(COLS, dtype=int) # column maximums, computed once per frame
+renderQueue = queue.Queue(maxsize=1)   # latest frame snapshot awaiting display
+renderErrors = queue.SimpleQueue()     # tracebacks from the render thread, printed by the sensor loop
+ikon       = None         # 8x8 array of dots, populated by processData()
+# single-hot target rows, indexed by the target column
+TARGET_ROWS      = tuple(tuple(DOTS[0] if x == i else DOTS[8] for x in range(COLS)) for i in range(COLS))
+TARGET_ROWS_NEAR = tuple(tuple(DOTS[1] if x == i else DOTS[8] for x in range(COLS)) for i in range(COLS))
 
 
 # functions ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
 def dot(value):
     '''
-    Return a colored dot indicating the range.
+    Return a colored dot indicating the range. The dot is the first
+    whose LIMIT is at or above the value, or the last if out of range.
     '''
-    if value   <= LIMIT[0]:
-        return DOTS[0]
-    elif value <= LIMIT[1]:
-        return DOTS[1]
-    elif value <= LIMIT[2]:
-        return DOTS[2]
-    elif value <= LIMIT[3]:
-        return DOTS[3]
-    elif value <= LIMIT[4]:
-        return DOTS[4]
-    elif value <= LIMIT[5]:
-        return DOTS[5]
-    elif value <= LIMIT[6]:
-        return DOTS[6]
-    elif value <= LIMIT[7]:
-        return DOTS[7]
-    else: # (out of range)
-        return DOTS[8]
+    return DOTS[bisect_left(LIMIT, value)]
+
+def dots(values):
+    '''
+    Return an array of colored dots for an array of values, as dot()
+    but for all values in one pass.
+    '''
+    return DOTS_ARR[np.searchsorted(LIMIT_ARR, values, side='left')]
 
 dLimit = 2500.0
 
-def showMatrix11x7():
+def printFrame():
+    '''
+    Prints the current frame's column statistics to the console. This is
+    called from the sensor loop so that all console output stays on one
+    thread.
+    '''
+    # print minimum distance ...............................
+    print("\n           min:     {}  {}  {}  {}  {}  {}  {}  {}".format(*colMin))
+    # print maximum distance ...............................
+    print("           max:     {}  {}  {}  {}  {}  {}  {}  {}".format(*colMax))
+    # print maximum mean distance ..........................
+    print(TARGET_FORMAT.format(*TARGET_ROWS[indexMax]))
+    print("  mean dist mm:     {:<4}  {:<4}  {:<4}  {:<4}  {:<4}  {:<4}  {:<4}  {:<4}".format(
+            *meanArr.astype(int).tolist()) + Style.RESET_ALL)
+
+
+def showMatrix11x7(colMin, colMax, indexMax):
     '''
-    Displays the matrix and related data to the 11x7 LED matrix display.
+    Displays the provided frame snapshot to the 11x7 LED matrix display.
     '''
-    global mtrx, indexMax, ikon, read, count, okCount, failCount
+    global mtrx
 
     mtrx.clear()
-    # print minimum distance ...............................
-    minV = matrix.min(axis=0, keepdims=True)
-    print("\n           min:     {}  {}  {}  {}  {}  {}  {}  {}".format(
-            minV[0][0], minV[0][1], minV[0][2], minV[0][3], minV[0][4], minV[0][5], minV[0][6], minV[0][7] ))
-#           dot(minV[0][0]), dot(minV[0][1]), dot(minV[0][2]), dot(minV[0][3]), dot(minV[0][4]), dot(minV[0][5]), dot(minV[0][6]), dot(minV[0][7]) ))
-#   mean[0], mean[1], mean[2], mean[3], mean[4], mean[5], mean[6], mean[7]) 
     for col in range(8):
-        val = min(minV[0][col], dLimit)
+        val = min(colMin[col], dLimit)
         bright = min(( val / dLimit), 0.9 )
         mtrx.setMinimumColumn(col, bright)
-
-    # print maximum distance ...............................
-    maxV = matrix.max(axis=0, keepdims=True)
-    print("           max:     {}  {}  {}  {}  {}  {}  {}  {}".format(
-            maxV[0][0], maxV[0][1], maxV[0][2], maxV[0][3], maxV[0][4], maxV[0][5], maxV[0][6], maxV[0][7] ))
-
-    # print maximum mean distance ..........................
-    maxDot.fill(DOTS[8])
-    maxValue = mean[indexMax]
-    maxDot[indexMax] = DOTS[0]
-    print("        target:     {}  {}  {}  {}  {}  {}  {}  {}".format(
-            maxDot[0], maxDot[1], maxDot[2], maxDot[3], maxDot[4], maxDot[5], maxDot[6], maxDot[7]))
     mtrx.setTargetColumn(indexMax)
     mtrx.update()
 
@@ -147,72 +152,77 @@ def showMatrix():
     global indexMax, ikon, read, count, okCount, failCount
     # print header .........................................
     print(NNNN)
-    print(FG_COLOR + "  {:07d}   ".format(count)
-            + Fore.RED + "PORT"
-            + FG_COLOR + "     0     1     2     3     4     5     6     7     "
-            + Fore.GREEN + "STBD \n" + FG_COLOR )
+    print(HEADER.format(count))
     # print matrix .........................................
-    for r in range(8):
-        print("                    {}  {}  {}  {}  {}  {}  {}  {} \n".format(
-                ikon[r][0], ikon[r][1], ikon[r][2], ikon[r][3], ikon[r][4], ikon[r][5], ikon[r][6], ikon[r][7]))
+    for row in ikon:
+        print(ROW_FORMAT.format(*row))
     # print minimum distance ...............................
-    minV = matrix.min(axis=0, keepdims=True)
-    print("\n           min:     {}  {}  {}  {}  {}  {}  {}  {}".format(
-            dot(minV[0][0]), dot(minV[0][1]), dot(minV[0][2]), dot(minV[0][3]), dot(minV[0][4]), dot(minV[0][5]), dot(minV[0][6]), dot(minV[0][7]) ))
+    print("\n           min:     {}  {}  {}  {}  {}  {}  {}  {}".format(*dots(colMin)))
     # print maximum distance ...............................
-    maxV = matrix.max(axis=0, keepdims=True)
-    print("           max:     {}  {}  {}  {}  {}  {}  {}  {}".format(
-            dot(maxV[0][0]), dot(maxV[0][1]), dot(maxV[0][2]), dot(maxV[0][3]), dot(maxV[0][4]), dot(maxV[0][5]), dot(maxV[0][6]), dot(maxV[0][7]) ))
+    print("           max:     {}  {}  {}  {}  {}  {}  {}  {}".format(*dots(colMax)))
     # print mean distance by column ........................
-    print("          mean:     {}  {}  {}  {}  {}  {}  {}  {}".format(
-            dot(mean[0]), dot(mean[1]), dot(mean[2]), dot(mean[3]), dot(mean[4]), dot(mean[5]), dot(mean[6]), dot(mean[7])))
+    print("          mean:     {}  {}  {}  {}  {}  {}  {}  {}".format(*dots(meanArr)))
     # print maximum mean distance ..........................
-    maxDot.fill(DOTS[8])
-    maxValue = mean[indexMax]
-    if maxValue > MIN_DISTANCE_MM:
-        maxDot[indexMax] = DOTS[0]
+    if meanArr[indexMax] > MIN_DISTANCE_MM:
+        _target = TARGET_ROWS[indexMax]
     else:
-        maxDot[indexMax] = DOTS[1]
-    print("        target:     {}  {}  {}  {}  {}  {}  {}  {}".format(
-            maxDot[0], maxDot[1], maxDot[2], maxDot[3], maxDot[4], maxDot[5], maxDot[6], maxDot[7]))
+        _target = TARGET_ROWS_NEAR[indexMax]
+    print(TARGET_FORMAT.format(*_target))
     # print numeric distances in mm ........................
     print("  mean dist mm:     {:<4}  {:<4}  {:<4}  {:<4}  {:<4}  {:<4}  {:<4}  {:<4}".format(
-            mean[0], mean[1], mean[2], mean[3], mean[4], mean[5], mean[6], mean[7]) + Style.RESET_ALL)
+            *meanArr.astype(int).tolist()) + Style.RESET_ALL)
 
 
 def processData():
     '''
     Processes the data from the matrix.
     '''
-    global pi, matrix, mean, indexMax, startTime, count, read, okCount, failCount
+    global pi, matrix, ikon, indexMax, startTime, count, read, okCount, failCount
     try:
-        m = np.array([[0 for x in range(COLS)] for y in range(ROWS)])
-        for row in range(8):
-            # populate ikon and mean arrays
-            for col in range(8):
-                n = matrix[row,col]
-                ikon[row][col] = dot(n)
-                # calculate column means
-                mean[col] = round(statistics.fmean([
-                        matrix[0][col], matrix[1][col], matrix[2][col], matrix[3][col],
-                        matrix[4][col], matrix[5][col], matrix[6][col], matrix[7][col] ]))
-            row += 1
-        indexMax = mean.index(max(mean))
+        # populate ikon array in a single lookup
+        ikon = dots(matrix)
+        # calculate column minimums, maximums and means once per frame into reused buffers
+        np.min(matrix, axis=0, out=colMin)
+        np.max(matrix, axis=0, out=colMax)
+        np.mean(matrix, axis=0, out=meanArr)
+        np.rint(meanArr, out=meanArr)
+        indexMax = int(meanArr.argmax())
 #       showMatrix()
-        showMatrix11x7()
+        printFrame()
+        # hand a snapshot to the render thread, dropping it if the last is still being drawn
+        try:
+            renderQueue.put_nowait((colMin.copy(), colMax.copy(), indexMax))
+        except queue.Full:
+            pass
     except:
         print(Fore.RED + Style.BRIGHT + 'error in process data: {}'.format(traceback.format_exc()) + Style.RESET_ALL)
     finally:
+        # report any errors from the render thread here, on the sensor loop's thread
+        while not renderErrors.empty():
+            print(Fore.RED + Style.BRIGHT + 'error in render loop: {}'.format(renderErrors.get()) + Style.RESET_ALL)
         if read > 0:
             okRate = int(okCount / read * 100)
             failRate = int(failCount / read * 100)
         else:
             okRate = 0
             failRate = 0
-        executionMs = int( (datetime.datetime.now() - startTime).total_seconds() * 1000 )
+        executionMs = (time.monotonic_ns() - startTime) // 1_000_000
         print(FG_COLOR + '\n    ok: {}%; fail: {}%; loop: {}ms elapsed.\n'.format(okRate, failRate, executionMs) + Style.RESET_ALL)
 
 
+def renderLoop():
+    '''
+    Displays frame snapshots as they arrive, so that LED matrix writes do
+    not hold up the sensor loop. An error drawing a frame is passed back to
+    the sensor loop to print, and the next frame is still drawn.
+    '''
+    while True:
+        try:
+            showMatrix11x7(*renderQueue.get())
+        except:
+            renderErrors.put(traceback.format_exc())
+
+
 def hasArg(arg):
     '''
     Returns true if the command line arguments contains the argument.
@@ -229,7 +239,7 @@ def getVL53():
     '''
     Instantiate the sensor.
     '''
-    stime = datetime.datetime.now()
+    stime = time.monotonic_ns()
 #   if len(sys.argv) > 1 and sys.argv[1] == 'skip':
     if hasArg('skip'):
         print("initialising VL53L5CX…")
@@ -241,7 +251,7 @@ def getVL53():
     vl53.set_ranging_frequency_hz(15)
     vl53.set_integration_time_ms(20)
     vl53.set_ranging_mode(RANGING_MODE_CONTINUOUS)
-    executionMs = int((datetime.datetime.now() - stime).total_seconds() * 1000)
+    executionMs = (time.monotonic_ns() - stime) // 1_000_000
     print(Fore.BLUE + 'get VL53: {}ms elapsed.'.format(executionMs) + Style.RESET_ALL)
     return vl53
 
@@ -250,11 +260,11 @@ def getVL53():
     Wait until the data from the vl53 is ready, returning the data, otherwise None upon a timeout.
 '''
 def getData(sensor):
-    stime = datetime.datetime.now()
+    stime = time.monotonic_ns()
     for i in range(1,20):
         if sensor.data_ready():
             data = sensor.get_data() # 2d array of distance
-            executionMs = int((datetime.datetime.now() - stime).total_seconds() * 1000)
+            executionMs = (time.monotonic_ns() - stime) // 1_000_000
             print(Fore.CYAN + 'get data: {}ms elapsed.'.format(executionMs) + Style.RESET_ALL)
             return data
         time.sleep(1 / 1000)
@@ -301,6 +311,7 @@ def main(argv):
         print(Fore.GREEN + Style.DIM + 'begin…' + Style.RESET_ALL)
 
         mtrx = Matrix()
+        Thread(name='render-loop', target=renderLoop, daemon=True).start()
 
         # set up VL53L5CX
         vl53 = getVL53()
@@ -308,14 +319,12 @@ def main(argv):
 
         print(Fore.GREEN + 'starting loop…' + Style.RESET_ALL)
         while True:
-            startTime = datetime.datetime.now()
+            startTime = time.monotonic_ns()
             count += 1
             data = getData(vl53)
             if data != None:
-                distance = np.array(data.distance_mm).reshape((8, 8))
-                for x in range(0,8):
-                    for y in range(0,8):
-                        matrix[x,y] = distance[x][y]
+                # view the driver's ctypes array in place rather than copying it into a new list-backed array
+                np.copyto(matrix, np.ctypeslib.as_array(data.distance_mm).reshape((8, 8)))
                 processData()
 
     except KeyboardInterrupt: